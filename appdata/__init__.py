@@ -0,0 +1,2 @@
+# Static data package
+# Translation tables and the tractor catalog shared by the web app
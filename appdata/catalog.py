@@ -0,0 +1,196 @@
+# appdata/catalog.py - Static tractor company, review and recommendation data
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Tuple
+
+# Sample data for top 5 tractor companies based on sales
+TRACTOR_COMPANIES = [
+    {
+        "id": 1,
+        "name": "John Deere",
+        "sales_rank": 1,
+        "annual_sales": 45000,
+        "price_range": "$35,000 - $150,000",
+        "popular_models": ["5075E", "6120M", "8R Series"],
+        "avg_rating": 4.5,
+        "total_reviews": 1250,
+        "financing_available": True,
+        "emi_starting": 2800,
+        "fuel_efficiency": "12-15 L/hr",
+        "warranty_years": 4,
+        "service_centers": 450,
+        "availability_status": "In Stock",
+        "delivery_time": "2-3 weeks"
+    },
+    {
+        "id": 2,
+        "name": "Mahindra",
+        "sales_rank": 2,
+        "annual_sales": 38000,
+        "price_range": "$25,000 - $80,000",
+        "popular_models": ["2638 HST", "4540 4WD", "6075 Power+"],
+        "avg_rating": 4.3,
+        "total_reviews": 890,
+        "financing_available": True,
+        "emi_starting": 2200,
+        "fuel_efficiency": "10-13 L/hr",
+        "warranty_years": 3,
+        "service_centers": 380,
+        "availability_status": "Limited Stock",
+        "delivery_time": "3-4 weeks"
+    },
+    {
+        "id": 3,
+        "name": "New Holland",
+        "sales_rank": 3,
+        "annual_sales": 32000,
+        "price_range": "$30,000 - $120,000",
+        "popular_models": ["T4.75", "T6.180", "T7.315"],
+        "avg_rating": 4.2,
+        "total_reviews": 720,
+        "financing_available": True,
+        "emi_starting": 2500,
+        "fuel_efficiency": "11-14 L/hr",
+        "warranty_years": 3,
+        "service_centers": 320,
+        "availability_status": "In Stock",
+        "delivery_time": "2-3 weeks"
+    },
+    {
+        "id": 4,
+        "name": "Kubota",
+        "sales_rank": 4,
+        "annual_sales": 28000,
+        "price_range": "$20,000 - $90,000",
+        "popular_models": ["M7-172", "L3901", "BX2380"],
+        "avg_rating": 4.4,
+        "total_reviews": 650,
+        "financing_available": True,
+        "emi_starting": 1800,
+        "fuel_efficiency": "9-12 L/hr",
+        "warranty_years": 5,
+        "service_centers": 280,
+        "availability_status": "Pre-Order",
+        "delivery_time": "6-8 weeks"
+    },
+    {
+        "id": 5,
+        "name": "Case IH",
+        "sales_rank": 5,
+        "annual_sales": 25000,
+        "price_range": "$40,000 - $180,000",
+        "popular_models": ["Farmall 75A", "Maxxum 145", "Magnum 340"],
+        "avg_rating": 4.1,
+        "total_reviews": 580,
+        "financing_available": True,
+        "emi_starting": 3200,
+        "fuel_efficiency": "13-16 L/hr",
+        "warranty_years": 4,
+        "service_centers": 250,
+        "availability_status": "In Stock",
+        "delivery_time": "3-4 weeks"
+    }
+]
+
+# AI Recommendation system data
+CROP_TRACTOR_MAP = {
+    'wheat': [1, 2, 3],  # John Deere, Mahindra, New Holland
+    'rice': [2, 4, 1],   # Mahindra, Kubota, John Deere
+    'cotton': [1, 5, 3], # John Deere, Case IH, New Holland
+    'sugarcane': [5, 1, 2], # Case IH, John Deere, Mahindra
+    'vegetables': [4, 2, 3], # Kubota, Mahindra, New Holland
+    'fruits': [4, 3, 1]  # Kubota, New Holland, John Deere
+}
+
+# Sample farmer reviews
+FARMER_REVIEWS = [
+    {
+        "company_id": 1,
+        "farmer_name": "Rajesh Kumar",
+        "location": "Punjab",
+        "model": "John Deere 5075E",
+        "rating": 5,
+        "review": "Excellent fuel efficiency and reliability. Perfect for my 25-acre farm.",
+        "verified_purchase": True
+    },
+    {
+        "company_id": 2,
+        "farmer_name": "Suresh Patel",
+        "location": "Gujarat",
+        "model": "Mahindra 4540 4WD",
+        "rating": 4,
+        "review": "Good value for money. Strong performance in heavy soil conditions.",
+        "verified_purchase": True
+    },
+    {
+        "company_id": 1,
+        "farmer_name": "Ravi Singh",
+        "location": "Haryana",
+        "model": "John Deere 6120M",
+        "rating": 5,
+        "review": "Outstanding build quality and after-sales service. Highly recommended!",
+        "verified_purchase": True
+    },
+    {
+        "company_id": 3,
+        "farmer_name": "Mohan Reddy",
+        "location": "Andhra Pradesh",
+        "model": "New Holland T4.75",
+        "rating": 4,
+        "review": "Smooth operation and comfortable cabin. Good for long working hours.",
+        "verified_purchase": True
+    },
+    {
+        "company_id": 4,
+        "farmer_name": "Anil Sharma",
+        "location": "Rajasthan",
+        "model": "Kubota L3901",
+        "rating": 4,
+        "review": "Compact yet powerful. Perfect for small to medium farms.",
+        "verified_purchase": True
+    }
+]
+
+@dataclass(frozen=True, slots=True)
+class Company:
+    """One tractor company; field order matches the JSON served by /api/companies"""
+    id: int
+    name: str
+    sales_rank: int
+    annual_sales: int
+    price_range: str
+    popular_models: Tuple[str, ...]
+    avg_rating: float
+    total_reviews: int
+    financing_available: bool
+    emi_starting: int
+    fuel_efficiency: str
+    warranty_years: int
+    service_centers: int
+    availability_status: str
+    delivery_time: str
+
+@dataclass(frozen=True, slots=True)
+class Review:
+    """One farmer review of a company"""
+    company_id: int
+    farmer_name: str
+    location: str
+    model: str
+    rating: int
+    review: str
+    verified_purchase: bool
+
+def freeze_row(row):
+    """Return a read-only view of a data row, with list values turned into tuples"""
+    return MappingProxyType({k: tuple(v) if isinstance(v, list) else v for k, v in row.items()})
+
+# Static data is read-only from here on; freezing it also keeps lookup indices
+# built from it valid
+TRACTOR_COMPANIES = tuple(
+    Company(**{**c, 'name': sys.intern(c['name']), 'popular_models': tuple(c['popular_models'])})
+    for c in TRACTOR_COMPANIES
+)
+FARMER_REVIEWS = tuple(Review(**r) for r in FARMER_REVIEWS)
+CROP_TRACTOR_MAP = MappingProxyType({crop: tuple(ids) for crop, ids in CROP_TRACTOR_MAP.items()})
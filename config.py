@@ -1,9 +1,16 @@
 # config.py - Configuration management for FramTrack
 import os
-from typing import Dict, List
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping
+import numpy as np
 from pydantic_settings import BaseSettings
 from pydantic import validator
 
+_VALID_ENVS = frozenset({"development", "testing", "production"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
     
@@ -38,9 +45,9 @@ class Settings(BaseSettings):
     log_file: str = "framtrack.log"
     
     # Security Settings
-    cors_origins: List[str] = ["*"]
-    cors_methods: List[str] = ["GET", "POST", "PUT", "DELETE"]
-    cors_headers: List[str] = ["*"]
+    cors_origins: FrozenSet[str] = frozenset({"*"})
+    cors_methods: FrozenSet[str] = frozenset({"GET", "POST", "PUT", "DELETE"})
+    cors_headers: FrozenSet[str] = frozenset({"*"})
     
     # Rate Limiting
     rate_limit_per_minute: int = 100
@@ -54,18 +61,20 @@ class Settings(BaseSettings):
     
     @validator('environment')
     def validate_environment(cls, v):
-        if v not in ['development', 'testing', 'production']:
+        if v not in _VALID_ENVS:
             raise ValueError('Environment must be development, testing, or production')
         return v
     
     @validator('log_level')
     def validate_log_level(cls, v):
-        if v not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
+        if v not in _VALID_LOG_LEVELS:
             raise ValueError('Invalid log level')
         return v
     
     class Config:
-        env_file = ".env"
+        # Only read a .env file when one exists; containers that populate the
+        # environment directly skip the file I/O entirely
+        env_file = os.environ.get("FRAMTRACK_ENV_FILE", ".env" if os.path.exists(".env") else None)
         env_prefix = "FRAMTRACK_"
 
 # Company Configuration
@@ -132,6 +141,9 @@ TRACTOR_COMPANIES_CONFIG = {
     }
 }
 
+# Company names key lookups across modules; intern them so equal names share one object
+TRACTOR_COMPANIES_CONFIG = {sys.intern(k): v for k, v in TRACTOR_COMPANIES_CONFIG.items()}
+
 # Seasonal Factors Configuration
 SEASONAL_FACTORS = {
     1: {"factor": 0.7, "description": "Winter planning period, low equipment purchases"},
@@ -148,6 +160,18 @@ SEASONAL_FACTORS = {
     12: {"factor": 0.8, "description": "Year-end, budget planning for next season"}
 }
 
+# Column-oriented (struct-of-arrays) views of the company and seasonal config
+# for vectorized analytics; rows are aligned to COMPANY_NAMES.
+# Three significant digits is plenty for these figures, so arrays are single
+# precision; combine them with CONFIG_DTYPE values to avoid upcasting to float64.
+CONFIG_DTYPE = np.float32
+COMPANY_NAMES = tuple(TRACTOR_COMPANIES_CONFIG)
+COMPANY_SOA = {
+    field: np.array([TRACTOR_COMPANIES_CONFIG[c][field] for c in COMPANY_NAMES], dtype=CONFIG_DTYPE)
+    for field in ("base_sales", "market_share", "volatility", "growth_trend", "seasonal_sensitivity")
+}
+SEASONAL_FACTOR_ARRAY = np.array([SEASONAL_FACTORS[m]["factor"] for m in range(1, 13)], dtype=CONFIG_DTYPE)
+
 # Market Trends Configuration
 MARKET_TRENDS_CONFIG = {
     "precision_agriculture": {
@@ -228,25 +252,38 @@ API_RESPONSES = {
     }
 }
 
-# Initialize settings
-settings = Settings()
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings"""
-    return settings
+    """Get application settings (validated once per process)"""
+    return Settings()
+
+def __getattr__(name: str):
+    """Resolve the module-level ``settings`` lazily on first access (PEP 562)"""
+    if name == "settings":
+        globals()["settings"] = get_settings()
+        return globals()["settings"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Derived lookup constants
+_DEFAULT_SEASONAL_FACTOR = MappingProxyType({"factor": 1.0, "description": "Standard season"})
 
-def get_company_config(company_name: str) -> Dict:
+# The cached results are shared by every caller, so they are returned as read-only views
+@lru_cache(maxsize=32)
+def get_company_config(company_name: str) -> Mapping:
     """Get configuration for a specific company"""
-    return TRACTOR_COMPANIES_CONFIG.get(company_name, {})
+    return MappingProxyType(TRACTOR_COMPANIES_CONFIG.get(company_name, {}))
 
-def get_seasonal_factor(month: int) -> Dict:
+@lru_cache(maxsize=32)
+def get_seasonal_factor(month: int) -> Mapping:
     """Get seasonal factor for a specific month"""
-    return SEASONAL_FACTORS.get(month, {"factor": 1.0, "description": "Standard season"})
+    factor = SEASONAL_FACTORS.get(month)
+    return _DEFAULT_SEASONAL_FACTOR if factor is None else MappingProxyType(factor)
 
 def get_all_companies() -> List[str]:
     """Get list of all configured companies"""
-    return list(TRACTOR_COMPANIES_CONFIG.keys())
+    return list(COMPANY_NAMES)
 
+@lru_cache(maxsize=32)
 def validate_company_name(company_name: str) -> bool:
     """Validate if company name exists in configuration"""
     return company_name in TRACTOR_COMPANIES_CONFIG
@@ -254,38 +291,40 @@ def validate_company_name(company_name: str) -> bool:
 # Environment-specific configurations
 def get_database_url() -> str:
     """Get database URL based on environment"""
-    if settings.environment == "testing":
+    s = get_settings()
+    if s.environment == "testing":
         return "sqlite:///test_framtrack.db"
-    elif settings.environment == "production":
-        return f"sqlite:///{settings.database_path}"
+    elif s.environment == "production":
+        return f"sqlite:///{s.database_path}"
     else:
-        return f"sqlite:///{settings.database_path}"
+        return f"sqlite:///{s.database_path}"
 
 def get_log_config() -> Dict:
     """Get logging configuration"""
+    s = get_settings()
     return {
         "version": 1,
         "disable_existing_loggers": False,
         "formatters": {
             "default": {
-                "format": settings.log_format,
+                "format": s.log_format,
             },
         },
         "handlers": {
             "console": {
                 "class": "logging.StreamHandler",
-                "level": settings.log_level,
+                "level": s.log_level,
                 "formatter": "default",
             },
             "file": {
                 "class": "logging.FileHandler",
-                "level": settings.log_level,
+                "level": s.log_level,
                 "formatter": "default",
-                "filename": settings.log_file,
+                "filename": s.log_file,
             },
         },
         "root": {
-            "level": settings.log_level,
+            "level": s.log_level,
             "handlers": ["console", "file"],
         },
     }
\ No newline at end of file
@@ -2,11 +2,95 @@
 import aiohttp
 import asyncio
 from bs4 import BeautifulSoup
-import json
-import random
+import orjson
+import numpy as np
+import sys
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from config import get_settings
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# One pooled session shared by all scrapers so keep-alive connections,
+# DNS lookups and TLS state survive across scrape cycles
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+# The loop the session was created on; a session can't be used from another loop
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Get the shared client session, creating it on first use in each event loop"""
+    global _SHARED_SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed or _SESSION_LOOP is not loop:
+        _SESSION_LOOP = loop
+        _SHARED_SESSION = aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS,
+            connector=aiohttp.TCPConnector(
+                limit=get_settings().max_concurrent_requests,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+        )
+    return _SHARED_SESSION
+
+async def close_shared_session():
+    """Close the shared client session; call once before the event loop shuts down"""
+    global _SHARED_SESSION, _SESSION_LOOP
+    if (
+        _SHARED_SESSION is not None
+        and not _SHARED_SESSION.closed
+        and _SESSION_LOOP is asyncio.get_running_loop()
+    ):
+        await _SHARED_SESSION.close()
+    _SHARED_SESSION = None
+    _SESSION_LOOP = None
+
+# Month-indexed lookup tables (index 0 unused) so datetime.month maps straight to a value;
+# lookups check 1 <= month <= 12 first, since 0 and negative indices would not raise
+_SEASONAL_FACTOR_BY_MONTH = (
+    None,
+    0.7,   # January - Low season
+    0.75,  # February - Preparing for spring
+    1.2,   # March - Spring preparation peak
+    1.35,  # April - Peak planting season
+    1.4,   # May - Peak season continues
+    1.1,   # June - Mid-season
+    0.9,   # July - Summer lull
+    0.85,  # August - Late summer
+    1.15,  # September - Fall preparation
+    1.25,  # October - Harvest season
+    0.95,  # November - Post-harvest
+    0.8    # December - Year-end
+)
+
+_SEASON_BY_MONTH = (
+    None,
+    'Winter/Preparation', 'Winter/Preparation',
+    'Spring Planting', 'Spring Planting', 'Spring Planting',
+    'Growing Season', 'Growing Season', 'Growing Season',
+    'Harvest Season', 'Harvest Season', 'Harvest Season',
+    'Winter/Preparation'
+)
+
+_DESC_BY_MONTH = (
+    None,
+    'Planning and budgeting period for upcoming season',
+    'Equipment maintenance and preparation',
+    'Spring equipment purchases peak',
+    'Highest demand for planting equipment',
+    'Continued strong demand for agricultural machinery',
+    'Moderate demand, focus on cultivation equipment',
+    'Summer maintenance period, lower new sales',
+    'Preparation for harvest season equipment',
+    'Harvest equipment demand increases',
+    'Peak harvest season, high combine sales',
+    'Post-harvest evaluation and planning',
+    'Year-end deals and next year preparation'
+)
+
 class TractorDataScraper:
     """
     Alternative data scraper for tractor information
@@ -15,17 +99,15 @@ class TractorDataScraper:
     
     def __init__(self):
         self.session = None
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        self.headers = DEFAULT_HEADERS
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        self.session = await _get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The shared session outlives this scraper; see close_shared_session()
+        self.session = None
     
     async def scrape_tractor_data_com(self) -> Dict:
         """
@@ -37,13 +119,13 @@ class TractorDataScraper:
             async with self.session.get(url) as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = BeautifulSoup(html, 'lxml')
                     
                     # Extract manufacturer information
                     manufacturers = []
-                    manufacturer_links = soup.find_all('a', href=lambda x: x and 'manufacturer' in x)
+                    manufacturer_links = soup.select('a[href*="manufacturer"]', limit=10)
                     
-                    for link in manufacturer_links[:10]:  # Top 10 manufacturers
+                    for link in manufacturer_links:  # Top 10 manufacturers
                         manufacturers.append({
                             'name': link.text.strip(),
                             'url': link.get('href')
@@ -64,26 +146,27 @@ class TractorDataScraper:
         """
         try:
             # Simulate fetching market news with realistic content
+            today = datetime.now().strftime('%Y-%m-%d')
             news_items = [
                 {
                     'title': 'John Deere Reports Strong Q4 Equipment Sales',
                     'impact': 'positive',
                     'market_effect': 5.2,
-                    'date': datetime.now().strftime('%Y-%m-%d'),
+                    'date': today,
                     'source': 'Agricultural News Network'
                 },
                 {
                     'title': 'Kubota Expands North American Market Presence',
                     'impact': 'positive',
                     'market_effect': 3.8,
-                    'date': datetime.now().strftime('%Y-%m-%d'),
+                    'date': today,
                     'source': 'Farm Equipment Magazine'
                 },
                 {
                     'title': 'New Holland Launches Advanced Precision Farming Technology',
                     'impact': 'positive',
                     'market_effect': 2.9,
-                    'date': datetime.now().strftime('%Y-%m-%d'),
+                    'date': today,
                     'source': 'Modern Agriculture Today'
                 }
             ]
@@ -100,24 +183,8 @@ class TractorDataScraper:
         """
         current_month = datetime.now().month
         
-        # Seasonal factors based on farming cycles
-        seasonal_map = {
-            1: 0.7,   # January - Low season
-            2: 0.75,  # February - Preparing for spring
-            3: 1.2,   # March - Spring preparation peak
-            4: 1.35,  # April - Peak planting season
-            5: 1.4,   # May - Peak season continues
-            6: 1.1,   # June - Mid-season
-            7: 0.9,   # July - Summer lull
-            8: 0.85,  # August - Late summer
-            9: 1.15,  # September - Fall preparation
-            10: 1.25, # October - Harvest season
-            11: 0.95, # November - Post-harvest
-            12: 0.8   # December - Year-end
-        }
-        
         return {
-            'current_factor': seasonal_map.get(current_month, 1.0),
+            'current_factor': _SEASONAL_FACTOR_BY_MONTH[current_month] if 1 <= current_month <= 12 else 1.0,
             'month': current_month,
             'season': self._get_season(current_month),
             'description': self._get_seasonal_description(current_month)
@@ -125,32 +192,11 @@ class TractorDataScraper:
     
     def _get_season(self, month: int) -> str:
         """Get agricultural season name"""
-        if month in [3, 4, 5]:
-            return 'Spring Planting'
-        elif month in [6, 7, 8]:
-            return 'Growing Season'
-        elif month in [9, 10, 11]:
-            return 'Harvest Season'
-        else:
-            return 'Winter/Preparation'
+        return _SEASON_BY_MONTH[month] if 1 <= month <= 12 else 'Winter/Preparation'
     
     def _get_seasonal_description(self, month: int) -> str:
         """Get description of seasonal market conditions"""
-        descriptions = {
-            1: 'Planning and budgeting period for upcoming season',
-            2: 'Equipment maintenance and preparation',
-            3: 'Spring equipment purchases peak',
-            4: 'Highest demand for planting equipment',
-            5: 'Continued strong demand for agricultural machinery',
-            6: 'Moderate demand, focus on cultivation equipment',
-            7: 'Summer maintenance period, lower new sales',
-            8: 'Preparation for harvest season equipment',
-            9: 'Harvest equipment demand increases',
-            10: 'Peak harvest season, high combine sales',
-            11: 'Post-harvest evaluation and planning',
-            12: 'Year-end deals and next year preparation'
-        }
-        return descriptions.get(month, 'Regular agricultural cycle')
+        return _DESC_BY_MONTH[month] if 1 <= month <= 12 else 'Regular agricultural cycle'
 
 class MockExternalAPI:
     """
@@ -166,52 +212,63 @@ class MockExternalAPI:
             "Mahindra": {"sales_trend": 1.12, "market_volatility": 0.20},
             "Massey Ferguson": {"sales_trend": 1.02, "market_volatility": 0.16}
         }
+        self.base_data = {sys.intern(k): v for k, v in self.base_data.items()}
+        # Column arrays so each update draws all companies in one batch
+        self._companies = list(self.base_data)
+        self._trends = np.array([v["sales_trend"] for v in self.base_data.values()])
+        self._vols = np.array([v["market_volatility"] for v in self.base_data.values()])
+        self._rng = np.random.default_rng()
     
     async def get_market_data(self) -> Dict:
         """Simulate API call to get market data"""
         await asyncio.sleep(0.5)  # Simulate network delay
         
-        market_data = {}
-        for company, factors in self.base_data.items():
-            # Simulate realistic market fluctuations
-            trend = factors["sales_trend"]
-            volatility = factors["market_volatility"]
-            
-            current_factor = trend * (1 + random.uniform(-volatility, volatility))
-            
-            market_data[company] = {
-                "growth_factor": round(current_factor, 3),
-                "confidence": random.uniform(0.7, 0.95),
-                "last_updated": datetime.now().isoformat()
+        now_iso = datetime.now().isoformat()
+        
+        # Simulate realistic market fluctuations
+        factors = np.round(self._trends * (1 + self._rng.uniform(-self._vols, self._vols)), 3)
+        confidence = self._rng.uniform(0.7, 0.95, size=len(self._companies))
+        
+        market_data = {
+            company: {
+                "growth_factor": factor,
+                "confidence": conf,
+                "last_updated": now_iso
             }
+            for company, factor, conf in zip(self._companies, factors.tolist(), confidence.tolist())
+        }
         
         return {
             "success": True,
             "data": market_data,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "source": "MockExternalAPI"
         }
 
+def _pretty(obj) -> str:
+    """Pretty-print JSON for the demo output"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
 # Usage example
 async def main():
     """Example usage of the data scraper"""
-    async with TractorDataScraper() as scraper:
-        # Get manufacturer data
-        tractor_data = await scraper.scrape_tractor_data_com()
-        print("Tractor Data:", json.dumps(tractor_data, indent=2))
-        
-        # Get market news
-        news = await scraper.get_market_news()
-        print("Market News:", json.dumps(news, indent=2))
-        
-        # Get seasonal factors
-        seasonal = await scraper.get_seasonal_factors()
-        print("Seasonal Factors:", json.dumps(seasonal, indent=2))
-    
-    # Test mock API
     mock_api = MockExternalAPI()
-    market_data = await mock_api.get_market_data()
-    print("Mock Market Data:", json.dumps(market_data, indent=2))
+    try:
+        async with TractorDataScraper() as scraper:
+            # Sources are independent, so fetch them concurrently
+            tractor_data, news, seasonal, market_data = await asyncio.gather(
+                scraper.scrape_tractor_data_com(),
+                scraper.get_market_news(),
+                scraper.get_seasonal_factors(),
+                mock_api.get_market_data()
+            )
+        
+        print("Tractor Data:", _pretty(tractor_data))
+        print("Market News:", _pretty(news))
+        print("Seasonal Factors:", _pretty(seasonal))
+        print("Mock Market Data:", _pretty(market_data))
+    finally:
+        await close_shared_session()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,17 @@
+# gunicorn.conf.py - Production server settings for the Flask app (gunicorn main:app)
+import os
+
+bind = "0.0.0.0:5000"
+
+# Import main.py once in the master; workers fork with the catalog, translations,
+# lookup indices and pre-encoded JSON already loaded (and gc.freeze()d) in shared
+# pages. The lru_cache'd page renders are filled per worker, on first request
+preload_app = True
+# Size from the CPUs this process may run on (container/cgroup pinning included),
+# not the host's count; sched_getaffinity is Linux-only, so other platforms fall
+# back to cpu_count(). WEB_CONCURRENCY overrides it
+_cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+workers = int(os.environ.get("WEB_CONCURRENCY") or _cpus * 2 + 1)
+worker_class = "gthread"
+threads = 4
+keepalive = 30
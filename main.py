@@ -1,10 +1,23 @@
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, redirect, g
+from flask.json.provider import JSONProvider
+from werkzeug.routing import BaseConverter
+import gc
+import hashlib
 import json
+import orjson
+import os
 import random
-from datetime import datetime, timedelta
+import threading
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict
 
+from cachetools import TTLCache
+
+from appdata.catalog import CROP_TRACTOR_MAP, FARMER_REVIEWS, TRACTOR_COMPANIES, freeze_row
+from appdata.translations import LANGUAGES
+
 try:
     from services.tractorguru_client import TractorGuruClient
     tg_client = TractorGuruClient()
@@ -14,215 +27,61 @@ except Exception:
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-for-sessions'
 
-# Language translations
-LANGUAGES = {
-    'en': {
-        'title': 'FarmTech Tractor Reviews',
-        'tagline': 'Top 5 Tractor Companies Based on Sales Performance',
-        'description': 'Discover the best tractor brands trusted by thousands of farmers. Rankings based on last year\'s sales data and farmer reviews.',
-        'search_placeholder': 'Search tractors, companies...',
-        'search_btn': 'Search',
-        'why_top_5': 'Why These Top 5?',
-        'highest_sales': 'Highest Sales',
-        'best_value': 'Best Value', 
-        'farmer_verified': 'Farmer Verified',
-        'reliable_service': 'Reliable Service',
-        'annual_sales': 'Annual Sales',
-        'price_range': 'Price Range',
-        'rating': 'Rating',
-        'popular_models': 'Popular Models',
-        'view_reviews': 'View Reviews & Details',
-        'back_to_companies': 'Back to Top Companies',
-        'sales_performance': 'Sales Performance',
-        'market_position': 'Market Position',
-        'pricing': 'Pricing',
-        'customer_satisfaction': 'Customer Satisfaction',
-        'farmer_reviews': 'Farmer Reviews',
-        'verified_purchase': 'Verified Purchase',
-        'model': 'Model',
-        'no_reviews': 'No reviews available yet. Be the first to review!'
-    },
-    'hi': {
-        'title': 'फार्मटेक ट्रैक्टर समीक्षा',
-        'tagline': 'बिक्री प्रदर्शन के आधार पर शीर्ष 5 ट्रैक्टर कंपनियां',
-        'description': 'हजारों किसानों द्वारा भरोसा किए गए सर्वोत्तम ट्रैक्टर ब्रांड खोजें। पिछले साल के बिक्री डेटा और किसान समीक्षाओं के आधार पर रैंकिंग।',
-        'search_placeholder': 'ट्रैक्टर, कंपनियां खोजें...',
-        'search_btn': 'खोजें',
-        'why_top_5': 'ये शीर्ष 5 क्यों?',
-        'highest_sales': 'उच्चतम बिक्री',
-        'best_value': 'सर्वोत्तम मूल्य',
-        'farmer_verified': 'किसान सत्यापित',
-        'reliable_service': 'विश्वसनीय सेवा',
-        'annual_sales': 'वार्षिक बिक्री',
-        'price_range': 'मूल्य सीमा',
-        'rating': 'रेटिंग',
-        'popular_models': 'लोकप्रिय मॉडल',
-        'view_reviews': 'समीक्षा और विवरण देखें',
-        'back_to_companies': 'शीर्ष कंपनियों पर वापस जाएं',
-        'sales_performance': 'बिक्री प्रदर्शन',
-        'market_position': 'बाजार स्थिति',
-        'pricing': 'मूल्य निर्धारण',
-        'customer_satisfaction': 'ग्राहक संतुष्टि',
-        'farmer_reviews': 'किसान समीक्षा',
-        'verified_purchase': 'सत्यापित खरीद',
-        'model': 'मॉडल',
-        'no_reviews': 'अभी तक कोई समीक्षा उपलब्ध नहीं है। पहले समीक्षा करें!'
-    },
-    'pa': {
-        'title': 'ਫਾਰਮਟੈਕ ਟਰੈਕਟਰ ਸਮੀਖਿਆਵਾਂ',
-        'tagline': 'ਵਿਕਰੀ ਪ੍ਰਦਰਸ਼ਨ ਦੇ ਆਧਾਰ ਤੇ ਸਿਖਰਲੀਆਂ 5 ਟਰੈਕਟਰ ਕੰਪਨੀਆਂ',
-        'description': 'ਹਜ਼ਾਰਾਂ ਕਿਸਾਨਾਂ ਦੁਆਰਾ ਭਰੋਸਾ ਕੀਤੇ ਗਏ ਸਭ ਤੋਂ ਵਧੀਆ ਟਰੈਕਟਰ ਬ੍ਰਾਂਡਾਂ ਦੀ ਖੋਜ ਕਰੋ। ਪਿਛਲੇ ਸਾਲ ਦੇ ਵਿਕਰੀ ਡੇਟਾ ਅਤੇ ਕਿਸਾਨ ਸਮੀਖਿਆਵਾਂ ਦੇ ਆਧਾਰ ਤੇ ਰੈਂਕਿੰਗ।',
-        'search_placeholder': 'ਟਰੈਕਟਰ, ਕੰਪਨੀਆਂ ਖੋਜੋ...',
-        'search_btn': 'ਖੋਜੋ',
-        'why_top_5': 'ਇਹ ਸਿਖਰਲੇ 5 ਕਿਉਂ?',
-        'highest_sales': 'ਸਭ ਤੋਂ ਵੱਧ ਵਿਕਰੀ',
-        'best_value': 'ਸਭ ਤੋਂ ਵਧੀਆ ਮੁੱਲ',
-        'farmer_verified': 'ਕਿਸਾਨ ਸਤਿਆਪਿਤ',
-        'reliable_service': 'ਭਰੋਸੇਮੰਦ ਸੇਵਾ',
-        'annual_sales': 'ਸਲਾਨਾ ਵਿਕਰੀ',
-        'price_range': 'ਕੀਮਤ ਸੀਮਾ',
-        'rating': 'ਰੇਟਿੰਗ',
-        'popular_models': 'ਪ੍ਰਸਿੱਧ ਮਾਡਲ',
-        'view_reviews': 'ਸਮੀਖਿਆਵਾਂ ਅਤੇ ਵੇਰਵੇ ਦੇਖੋ',
-        'back_to_companies': 'ਸਿਖਰਲੀਆਂ ਕੰਪਨੀਆਂ ਤੇ ਵਾਪਸ ਜਾਓ',
-        'sales_performance': 'ਵਿਕਰੀ ਪ੍ਰਦਰਸ਼ਨ',
-        'market_position': 'ਬਾਜ਼ਾਰ ਸਥਿਤੀ',
-        'pricing': 'ਕੀਮਤ ਨਿਰਧਾਰਨ',
-        'customer_satisfaction': 'ਗ੍ਰਾਹਕ ਸੰਤੁਸ਼ਟੀ',
-        'farmer_reviews': 'ਕਿਸਾਨ ਸਮੀਖਿਆਵਾਂ',
-        'verified_purchase': 'ਸਤਿਆਪਿਤ ਖਰੀਦ',
-        'model': 'ਮਾਡਲ',
-        'no_reviews': 'ਅਜੇ ਤੱਕ ਕੋਈ ਸਮੀਖਿਆ ਉਪਲਬਧ ਨਹੀਂ ਹੈ। ਪਹਿਲੇ ਸਮੀਖਿਆ ਕਰੋ!'
-    }
-}
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson; read-only mappings encode as objects"""
 
-def get_current_language():
-    return session.get('language', 'en')
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=dict).decode()
 
-def get_text(key):
-    lang = get_current_language()
-    return LANGUAGES[lang].get(key, LANGUAGES['en'][key])
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-# Sample data for top 5 tractor companies based on sales
-TRACTOR_COMPANIES = [
-    {
-        "id": 1,
-        "name": "John Deere",
-        "sales_rank": 1,
-        "annual_sales": 45000,
-        "price_range": "$35,000 - $150,000",
-        "popular_models": ["5075E", "6120M", "8R Series"],
-        "avg_rating": 4.5,
-        "total_reviews": 1250,
-        "financing_available": True,
-        "emi_starting": 2800,
-        "fuel_efficiency": "12-15 L/hr",
-        "warranty_years": 4,
-        "service_centers": 450,
-        "availability_status": "In Stock",
-        "delivery_time": "2-3 weeks"
-    },
-    {
-        "id": 2,
-        "name": "Mahindra",
-        "sales_rank": 2,
-        "annual_sales": 38000,
-        "price_range": "$25,000 - $80,000",
-        "popular_models": ["2638 HST", "4540 4WD", "6075 Power+"],
-        "avg_rating": 4.3,
-        "total_reviews": 890,
-        "financing_available": True,
-        "emi_starting": 2200,
-        "fuel_efficiency": "10-13 L/hr",
-        "warranty_years": 3,
-        "service_centers": 380,
-        "availability_status": "Limited Stock",
-        "delivery_time": "3-4 weeks"
-    },
-    {
-        "id": 3,
-        "name": "New Holland",
-        "sales_rank": 3,
-        "annual_sales": 32000,
-        "price_range": "$30,000 - $120,000",
-        "popular_models": ["T4.75", "T6.180", "T7.315"],
-        "avg_rating": 4.2,
-        "total_reviews": 720,
-        "financing_available": True,
-        "emi_starting": 2500,
-        "fuel_efficiency": "11-14 L/hr",
-        "warranty_years": 3,
-        "service_centers": 320,
-        "availability_status": "In Stock",
-        "delivery_time": "2-3 weeks"
-    },
-    {
-        "id": 4,
-        "name": "Kubota",
-        "sales_rank": 4,
-        "annual_sales": 28000,
-        "price_range": "$20,000 - $90,000",
-        "popular_models": ["M7-172", "L3901", "BX2380"],
-        "avg_rating": 4.4,
-        "total_reviews": 650,
-        "financing_available": True,
-        "emi_starting": 1800,
-        "fuel_efficiency": "9-12 L/hr",
-        "warranty_years": 5,
-        "service_centers": 280,
-        "availability_status": "Pre-Order",
-        "delivery_time": "6-8 weeks"
-    },
-    {
-        "id": 5,
-        "name": "Case IH",
-        "sales_rank": 5,
-        "annual_sales": 25000,
-        "price_range": "$40,000 - $180,000",
-        "popular_models": ["Farmall 75A", "Maxxum 145", "Magnum 340"],
-        "avg_rating": 4.1,
-        "total_reviews": 580,
-        "financing_available": True,
-        "emi_starting": 3200,
-        "fuel_efficiency": "13-16 L/hr",
-        "warranty_years": 4,
-        "service_centers": 250,
-        "availability_status": "In Stock",
-        "delivery_time": "3-4 weeks"
-    }
-]
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=dict), mimetype='application/json')
 
-# AI Recommendation system data
-CROP_TRACTOR_MAP = {
-    'wheat': [1, 2, 3],  # John Deere, Mahindra, New Holland
-    'rice': [2, 4, 1],   # Mahindra, Kubota, John Deere
-    'cotton': [1, 5, 3], # John Deere, Case IH, New Holland
-    'sugarcane': [5, 1, 2], # Case IH, John Deere, Mahindra
-    'vegetables': [4, 2, 3], # Kubota, Mahindra, New Holland
-    'fruits': [4, 3, 1]  # Kubota, New Holland, John Deere
-}
+app.json = ORJSONProvider(app)
 
-# Weather alerts data
-WEATHER_ALERTS = [
-    {
-        "region": "Punjab",
-        "alert": "Heavy rainfall expected. Check hydraulic systems and engine protection.",
-        "severity": "High",
-        "date": datetime.now().strftime("%Y-%m-%d")
-    },
-    {
-        "region": "Gujarat", 
-        "alert": "Dust storm warning. Clean air filters and check engine oil.",
-        "severity": "Medium",
-        "date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-    },
-    {
-        "region": "Haryana",
-        "alert": "High temperature forecast. Monitor coolant levels.",
-        "severity": "Medium", 
-        "date": (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
-    }
-]
+_LANGS = frozenset(LANGUAGES)
+
+class LanguageConverter(BaseConverter):
+    """URL segment restricted to supported language codes; anything else 404s in the router"""
+    regex = '|'.join(LANGUAGES)
+
+app.url_map.converters['lang'] = LanguageConverter
+
+# The language lives in a plain `lang` cookie rather than the signed session so
+# read-only pages never emit Set-Cookie and can be cached by a front proxy
+# keyed on (URL, lang cookie); see nginx.conf
+LANG_COOKIE = 'lang'
+
+# Weather alerts data, dated relative to today; rebuilt once when the day changes
+@lru_cache(maxsize=1)
+def _weather_alerts(day_ordinal):
+    today, tomorrow, day_after = (date.fromordinal(day_ordinal + n).isoformat() for n in range(3))
+    return tuple(freeze_row(alert) for alert in [
+        {
+            "region": "Punjab",
+            "alert": "Heavy rainfall expected. Check hydraulic systems and engine protection.",
+            "severity": "High",
+            "date": today
+        },
+        {
+            "region": "Gujarat", 
+            "alert": "Dust storm warning. Clean air filters and check engine oil.",
+            "severity": "Medium",
+            "date": tomorrow
+        },
+        {
+            "region": "Haryana",
+            "alert": "High temperature forecast. Monitor coolant levels.",
+            "severity": "Medium", 
+            "date": day_after
+        }
+    ])
+
+def get_weather_alerts():
+    return _weather_alerts(date.today().toordinal())
 
 # Community forum data
 FORUM_POSTS = [
@@ -252,98 +111,197 @@ FORUM_POSTS = [
     }
 ]
 
-# Sample farmer reviews
-FARMER_REVIEWS = [
-    {
-        "company_id": 1,
-        "farmer_name": "Rajesh Kumar",
-        "location": "Punjab",
-        "model": "John Deere 5075E",
-        "rating": 5,
-        "review": "Excellent fuel efficiency and reliability. Perfect for my 25-acre farm.",
-        "verified_purchase": True
-    },
-    {
-        "company_id": 2,
-        "farmer_name": "Suresh Patel",
-        "location": "Gujarat",
-        "model": "Mahindra 4540 4WD",
-        "rating": 4,
-        "review": "Good value for money. Strong performance in heavy soil conditions.",
-        "verified_purchase": True
-    },
-    {
-        "company_id": 1,
-        "farmer_name": "Ravi Singh",
-        "location": "Haryana",
-        "model": "John Deere 6120M",
-        "rating": 5,
-        "review": "Outstanding build quality and after-sales service. Highly recommended!",
-        "verified_purchase": True
-    },
-    {
-        "company_id": 3,
-        "farmer_name": "Mohan Reddy",
-        "location": "Andhra Pradesh",
-        "model": "New Holland T4.75",
-        "rating": 4,
-        "review": "Smooth operation and comfortable cabin. Good for long working hours.",
-        "verified_purchase": True
-    },
-    {
-        "company_id": 4,
-        "farmer_name": "Anil Sharma",
-        "location": "Rajasthan",
-        "model": "Kubota L3901",
-        "rating": 4,
-        "review": "Compact yet powerful. Perfect for small to medium farms.",
-        "verified_purchase": True
-    }
+# Lookup indices built once from the static data above
+COMPANIES_BY_ID = {c.id: c for c in TRACTOR_COMPANIES}
+REVIEWS_BY_COMPANY = {}
+for review in FARMER_REVIEWS:
+    REVIEWS_BY_COMPANY.setdefault(review.company_id, []).append(review)
+REVIEWS_BY_COMPANY = {cid: tuple(reviews) for cid, reviews in REVIEWS_BY_COMPANY.items()}
+
+# Lowercased name/model fields for /search, so queries don't re-lower static data
+_SEARCH_INDEX = [
+    (c, c.name.lower(), tuple(m.lower() for m in c.popular_models))
+    for c in TRACTOR_COMPANIES
 ]
 
-@app.route('/set_language/<lang>')
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _build_trigram_index():
+    # Trigram -> positions in _SEARCH_INDEX whose name or a model contains it
+    index = {}
+    for pos, (_, name_lc, models_lc) in enumerate(_SEARCH_INDEX):
+        for text in (name_lc,) + models_lc:
+            for tri in _trigrams(text):
+                index.setdefault(tri, set()).add(pos)
+    return index
+
+_TRIGRAM_INDEX = _build_trigram_index()
+_NO_MATCHES = frozenset()
+
+def _search_companies(query):
+    if len(query) < 3:
+        entries = _SEARCH_INDEX
+    else:
+        # Every trigram of the query must occur in the company's fields;
+        # the substring check below weeds out trigrams spread across fields
+        first, *rest = (_TRIGRAM_INDEX.get(tri, _NO_MATCHES) for tri in _trigrams(query))
+        candidates = first.intersection(*rest)
+        entries = [_SEARCH_INDEX[pos] for pos in sorted(candidates)]
+    return [
+        company for company, name_lc, models_lc in entries
+        if query in name_lc or any(query in m for m in models_lc)
+    ]
+
+# /api/companies serves fixed data, so encode it and its ETag once
+_COMPANIES_JSON = orjson.dumps(TRACTOR_COMPANIES)
+_COMPANIES_ETAG = hashlib.md5(_COMPANIES_JSON).hexdigest()
+_COMPANIES_LAST_MODIFIED = datetime.now(timezone.utc).replace(microsecond=0)
+
+# Translation tables encoded once per language for /api/i18n/<lang>
+_LANG_JSON = {lang: orjson.dumps(table, default=dict) for lang, table in LANGUAGES.items()}
+_LANG_ETAGS = {lang: hashlib.md5(body).hexdigest() for lang, body in _LANG_JSON.items()}
+
+# Encoded TractorGuru responses, reused for 10 minutes
+_tg_json = TTLCache(maxsize=512, ttl=600)
+_tg_lock = threading.Lock()
+# Upstream fetches in progress, so concurrent misses for one key share a single fetch
+_tg_inflight = {}
+# Seconds a request waits on another's fetch; a little over the client's 15s timeout
+_TG_WAIT_TIMEOUT = 20
+# Most ?path= values one model details request may ask for
+_TG_MAX_MODEL_PATHS = 20
+
+class _Flight:
+    __slots__ = ('done', 'body', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.body = None
+        self.error = None
+
+def _tg_cached_json(key, fetch):
+    with _tg_lock:
+        body = _tg_json.get(key)
+        flight = leader = None
+        if body is None:
+            flight = _tg_inflight.get(key)
+            if flight is None:
+                flight = leader = _tg_inflight[key] = _Flight()
+
+    if body is None and leader is None:
+        if not flight.done.wait(_TG_WAIT_TIMEOUT):
+            return jsonify({"error": "TractorGuru request timed out"}), 504
+        if flight.error is not None:
+            raise flight.error
+        body = flight.body
+    elif body is None:
+        result = None
+        try:
+            result = fetch()
+            body = leader.body = orjson.dumps(result)
+        except Exception as exc:
+            leader.error = exc
+            raise
+        finally:
+            with _tg_lock:
+                # Empty results usually mean a failed scrape; let the next request retry
+                if result:
+                    _tg_json[key] = body
+                del _tg_inflight[key]
+            leader.done.set()
+    return app.response_class(body, mimetype='application/json')
+
+@app.route('/set_language/<lang:lang>')
 def set_language(lang):
-    if lang in LANGUAGES:
-        session['language'] = lang
-    return request.referrer or '/'
+    response = redirect(request.referrer or '/')
+    response.set_cookie(LANG_COOKIE, lang, max_age=60 * 60 * 24 * 365, samesite='Lax')
+    return response
+
+@app.before_request
+def load_language():
+    # Resolve the language and its translation table once per request; templates
+    # read strings straight from `t` instead of calling back into Python
+    lang = request.cookies.get(LANG_COOKIE, 'en')
+    g.lang = lang if lang in _LANGS else 'en'
+    g.t = LANGUAGES[g.lang]
+
+# Anonymous GET pages that only depend on the URL and the language cookie
+_PROXY_CACHEABLE_ENDPOINTS = frozenset({
+    'home', 'company_details', 'weather_alerts', 'community_forum',
+    'analytics_dashboard', 'finance_calculator', 'availability_tracker',
+})
+
+@app.after_request
+def add_cache_headers(response):
+    if (request.method == 'GET' and response.status_code == 200
+            and request.endpoint in _PROXY_CACHEABLE_ENDPOINTS):
+        response.cache_control.public = True
+        response.cache_control.max_age = 300
+        response.vary.add('Cookie')
+    return response
+
+# Pages built only from static data are rendered once per language and reused.
+# The header echoes ?q= back into the search box, so requests with query args
+# always render fresh.
+@lru_cache(maxsize=8)
+def _render_home(lang):
+    return render_template('index.html', companies=TRACTOR_COMPANIES, t=LANGUAGES[lang], current_lang=lang)
+
+@lru_cache(maxsize=64)
+def _render_company(company_id, lang):
+    company = COMPANIES_BY_ID[company_id]
+    company_reviews = REVIEWS_BY_COMPANY.get(company_id, ())
+    return render_template('company_details.html', company=company, reviews=company_reviews, t=LANGUAGES[lang], current_lang=lang)
 
 @app.route('/')
 def home():
-    return render_template('index.html', companies=TRACTOR_COMPANIES, get_text=get_text, current_lang=get_current_language())
+    if request.args:
+        return render_template('index.html', companies=TRACTOR_COMPANIES, t=g.t, current_lang=g.lang)
+    return _render_home(g.lang)
 
 @app.route('/company/<int:company_id>')
 def company_details(company_id):
-    company = next((c for c in TRACTOR_COMPANIES if c['id'] == company_id), None)
+    company = COMPANIES_BY_ID.get(company_id)
     if not company:
         return "Company not found", 404
     
+    if not request.args:
+        return _render_company(company_id, g.lang)
+    
     # Get reviews for this company
-    company_reviews = [r for r in FARMER_REVIEWS if r['company_id'] == company_id]
+    company_reviews = REVIEWS_BY_COMPANY.get(company_id, ())
     
-    return render_template('company_details.html', company=company, reviews=company_reviews, get_text=get_text, current_lang=get_current_language())
+    return render_template('company_details.html', company=company, reviews=company_reviews, t=g.t, current_lang=g.lang)
+
+@lru_cache(maxsize=8)
+def _render_empty_search(lang):
+    return render_template('search_results.html', results=(), query='', t=LANGUAGES[lang], current_lang=lang)
 
 @app.route('/search')
 def search():
     query = request.args.get('q', '').lower()
-    results = []
+    if not query:
+        return _render_empty_search(g.lang)
     
-    if query:
-        # Search in company names and models
-        for company in TRACTOR_COMPANIES:
-            if query in company['name'].lower():
-                results.append(company)
-            else:
-                # Check if query matches any model
-                for model in company['popular_models']:
-                    if query in model.lower():
-                        results.append(company)
-                        break
+    # Search in company names and models
+    results = _search_companies(query)
     
-    return render_template('search_results.html', results=results, query=query, get_text=get_text, current_lang=get_current_language())
+    return render_template('search_results.html', results=results, query=query, t=g.t, current_lang=g.lang)
 
 @app.route('/ai-recommendations')
 def ai_recommendations():
-    return render_template('ai_recommendations.html', get_text=get_text, current_lang=get_current_language())
+    return render_template('ai_recommendations.html', t=g.t, current_lang=g.lang)
+
+_MATCH_SCORE_RANGE = range(85, 99)
+_score_rng = random.Random()
+
+# Top 3 recommended companies per crop, pre-encoded as JSON objects minus the
+# closing brace so a request only appends its match score and reason
+_BASE_REC = {
+    crop: tuple(orjson.dumps(COMPANIES_BY_ID[i])[:-1] for i in ids[:3] if i in COMPANIES_BY_ID)
+    for crop, ids in CROP_TRACTOR_MAP.items()
+}
 
 @app.route('/get-recommendations', methods=['POST'])
 def get_recommendations():
@@ -352,61 +310,74 @@ def get_recommendations():
     crop_type = data.get('crop_type', 'wheat').lower()
     budget = float(data.get('budget', 50000))
     
-    # AI recommendation logic
-    recommended_ids = CROP_TRACTOR_MAP.get(crop_type, [1, 2, 3])
-    recommendations = []
+    # AI recommendation logic; unknown crops get the wheat picks
+    base = _BASE_REC.get(crop_type, _BASE_REC['wheat'])
+    reason = orjson.dumps(f"Perfect for {crop_type} farming on {farm_size} acres")
     
-    for company_id in recommended_ids[:3]:  # Top 3 recommendations
-        company = next((c for c in TRACTOR_COMPANIES if c['id'] == company_id), None)
-        if company:
-            # Calculate match score based on multiple factors
-            score = random.randint(85, 98)  # Simulated AI score
-            recommendation = {
-                **company,
-                'match_score': score,
-                'reason': f"Perfect for {crop_type} farming on {farm_size} acres"
-            }
-            recommendations.append(recommendation)
+    # Calculate match scores based on multiple factors (simulated AI scores, drawn in one batch)
+    scores = _score_rng.choices(_MATCH_SCORE_RANGE, k=len(base))
     
-    return jsonify(recommendations)
+    body = b'[' + b','.join(
+        b'%s,"match_score":%d,"reason":%s}' % (company, score, reason)
+        for company, score in zip(base, scores)
+    ) + b']'
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/finance-calculator')
 def finance_calculator():
-    return render_template('finance_calculator.html', companies=TRACTOR_COMPANIES, get_text=get_text, current_lang=get_current_language())
+    return render_template('finance_calculator.html', companies=TRACTOR_COMPANIES, t=g.t, current_lang=g.lang)
 
 @app.route('/weather-alerts')
 def weather_alerts():
-    return render_template('weather_alerts.html', alerts=WEATHER_ALERTS, get_text=get_text, current_lang=get_current_language())
+    return render_template('weather_alerts.html', alerts=get_weather_alerts(), t=g.t, current_lang=g.lang)
 
 @app.route('/community-forum')
 def community_forum():
-    return render_template('community_forum.html', posts=FORUM_POSTS, get_text=get_text, current_lang=get_current_language())
+    return render_template('community_forum.html', posts=FORUM_POSTS, t=g.t, current_lang=g.lang)
 
 @app.route('/availability-tracker')
 def availability_tracker():
-    return render_template('availability_tracker.html', companies=TRACTOR_COMPANIES, get_text=get_text, current_lang=get_current_language())
+    return render_template('availability_tracker.html', companies=TRACTOR_COMPANIES, t=g.t, current_lang=g.lang)
+
+# Sample analytics data; its inputs are static, so it is built once
+_ANALYTICS_DATA = {
+    'total_tractors_sold': sum(c.annual_sales for c in TRACTOR_COMPANIES),
+    'avg_price': 75000,
+    'most_popular_brand': 'John Deere',
+    'monthly_sales': [3200, 3800, 4100, 3900, 4500, 5200],
+    'regional_preferences': {
+        'Punjab': 'John Deere',
+        'Gujarat': 'Mahindra', 
+        'Haryana': 'New Holland',
+        'UP': 'Kubota',
+        'Rajasthan': 'Case IH'
+    }
+}
 
 @app.route('/analytics-dashboard')
 def analytics_dashboard():
-    # Generate sample analytics data
-    analytics_data = {
-        'total_tractors_sold': sum(c['annual_sales'] for c in TRACTOR_COMPANIES),
-        'avg_price': 75000,
-        'most_popular_brand': 'John Deere',
-        'monthly_sales': [3200, 3800, 4100, 3900, 4500, 5200],
-        'regional_preferences': {
-            'Punjab': 'John Deere',
-            'Gujarat': 'Mahindra', 
-            'Haryana': 'New Holland',
-            'UP': 'Kubota',
-            'Rajasthan': 'Case IH'
-        }
-    }
-    return render_template('analytics_dashboard.html', analytics=analytics_data, get_text=get_text, current_lang=get_current_language())
+    return render_template('analytics_dashboard.html', analytics=_ANALYTICS_DATA, t=g.t, current_lang=g.lang)
 
 @app.route('/api/companies')
 def api_companies():
-    return jsonify(TRACTOR_COMPANIES)
+    resp = app.response_class(_COMPANIES_JSON, mimetype='application/json')
+    resp.set_etag(_COMPANIES_ETAG)
+    resp.last_modified = _COMPANIES_LAST_MODIFIED
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 3600
+    # Answers If-None-Match / If-Modified-Since with an empty 304
+    return resp.make_conditional(request)
+
+@app.route('/api/i18n/<lang>')
+def api_i18n(lang):
+    body = _LANG_JSON.get(lang)
+    if body is None:
+        return jsonify({"error": f"Unsupported language: {lang}"}), 404
+    resp = app.response_class(body, mimetype='application/json')
+    resp.set_etag(_LANG_ETAGS[lang])
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 60 * 60 * 24
+    return resp.make_conditional(request)
 
 # ========== TractorGuru integration (scraped public pages) ==========
 @app.route('/api/tractorguru/brands')
@@ -414,8 +385,7 @@ def api_tg_brands():
     if not tg_client:
         return jsonify({"error": "TractorGuru client unavailable"}), 503
     try:
-        brands = tg_client.get_brands()
-        return jsonify(brands)
+        return _tg_cached_json('brands', tg_client.get_brands)
     except Exception as exc:
         return jsonify({"error": str(exc)}), 500
 
@@ -428,8 +398,7 @@ def api_tg_brand_models():
     if not brand_path:
         return jsonify({"error": "Missing required query param: path"}), 400
     try:
-        models = tg_client.get_brand_models(brand_path)
-        return jsonify(models)
+        return _tg_cached_json(('brand_models', brand_path), lambda: tg_client.get_brand_models(brand_path))
     except Exception as exc:
         return jsonify({"error": str(exc)}), 500
 
@@ -438,14 +407,29 @@ def api_tg_brand_models():
 def api_tg_model_details():
     if not tg_client:
         return jsonify({"error": "TractorGuru client unavailable"}), 503
-    model_path = request.args.get('path', '')
-    if not model_path:
+    model_paths = [path for path in request.args.getlist('path') if path]
+    if not model_paths:
         return jsonify({"error": "Missing required query param: path"}), 400
+    if len(model_paths) > _TG_MAX_MODEL_PATHS:
+        return jsonify({"error": f"At most {_TG_MAX_MODEL_PATHS} path params are allowed"}), 400
+    # Several ?path= params return a list, even if they repeat one path
+    many = len(model_paths) > 1
+    # Repeats would only add cache keys for the same upstream pages
+    model_paths = list(dict.fromkeys(model_paths))
     try:
-        details = tg_client.get_model_details(model_path)
-        return jsonify(details)
+        if many:
+            return _tg_cached_json(('models_details', tuple(model_paths)), lambda: tg_client.get_models_details(model_paths))
+        model_path = model_paths[0]
+        return _tg_cached_json(('model_details', model_path), lambda: tg_client.get_model_details(model_path))
     except Exception as exc:
         return jsonify({"error": str(exc)}), 500
 
+# Everything allocated at import (static data, lookup indices, modules) lives for
+# the whole process; move it to the permanent generation so GC passes skip it and
+# forked workers don't dirty copy-on-write pages by scanning it
+gc.freeze()
+
+# Development server only; production runs under gunicorn (see gunicorn.conf.py).
+# Set FLASK_DEBUG=1 for the reloader and debugger
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv('FLASK_DEBUG') == '1')
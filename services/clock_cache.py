@@ -0,0 +1,135 @@
+import threading
+import time
+from typing import Any, Generic, Hashable, List, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class FrequencySketch:
+    """
+    TinyLFU-style frequency estimate: a 4-row Count-Min sketch of saturating 4-bit counters.
+    Counters are halved once the sample size is reached, so old popularity fades.
+    Not thread-safe; ClockCache calls it under its lock.
+    """
+
+    _MAX_COUNT = 15
+    # One odd 64-bit multiplier per row; each row takes the high bits of
+    # hash(key) * multiplier, so keys colliding in one row rarely collide in the others
+    _ROW_MULTIPLIERS = (
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0xD6E8FEB86659FD93,
+    )
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, width: int) -> None:
+        # Power-of-two width so a row index is just the top bits of the mixed hash
+        bits = max(width - 1, 15).bit_length()
+        self._width = 1 << bits
+        self._shift = 64 - bits
+        self._table = bytearray(len(self._ROW_MULTIPLIERS) * self._width)
+        self._sample_size = 10 * self._width
+        self._additions = 0
+
+    def _slots(self, key: Hashable) -> List[int]:
+        h = hash(key) & self._MASK64
+        return [
+            row * self._width + (((h * multiplier) & self._MASK64) >> self._shift)
+            for row, multiplier in enumerate(self._ROW_MULTIPLIERS)
+        ]
+
+    def increment(self, key: Hashable) -> None:
+        table = self._table
+        for i in self._slots(key):
+            if table[i] < self._MAX_COUNT:
+                table[i] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = bytearray(count >> 1 for count in table)
+            self._additions //= 2
+
+    def frequency(self, key: Hashable) -> int:
+        table = self._table
+        return min(table[i] for i in self._slots(key))
+
+
+class ClockCache(Generic[K, V]):
+    """
+    Fixed-size cache with CLOCK (second-chance) eviction and a per-entry TTL.
+    - A hit only sets the entry's reference bit, so reads never reorder entries; only
+      admission caches take the lock on reads, briefly, to count the request.
+    - Writes sweep the clock hand past referenced entries to pick a victim.
+    - With admission=True, a TinyLFU sketch keeps a new key out unless it has been
+      requested at least as often as the entry it would evict.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, admission: bool = False) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Each slot is [key, value, expires_at, referenced]
+        self._slots: List[List[Any]] = []
+        self._index: dict = {}
+        self._hand = 0
+        self._lock = threading.Lock()
+        self._sketch = FrequencySketch(maxsize) if admission else None
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        if self._sketch is not None:
+            # Shared with writers' frequency checks and the sketch's periodic halving
+            with self._lock:
+                self._sketch.increment(key)
+        pos = self._index.get(key)
+        if pos is None:
+            return default
+        slot = self._slots[pos]
+        # The slot may have been reused for another key since the index lookup
+        if slot[0] != key or slot[2] < time.monotonic():
+            return default
+        slot[3] = True
+        return slot[1]
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        now = time.monotonic()
+        with self._lock:
+            pos = self._index.get(key)
+            if pos is not None:
+                self._slots[pos] = [key, value, now + self.ttl, True]
+                return
+            if len(self._slots) < self.maxsize:
+                self._index[key] = len(self._slots)
+                self._slots.append([key, value, now + self.ttl, False])
+                return
+
+            # Second chance: clear reference bits until an unreferenced or expired entry turns up
+            while True:
+                victim = self._slots[self._hand]
+                if not victim[3] or victim[2] < now:
+                    break
+                victim[3] = False
+                self._hand = (self._hand + 1) % self.maxsize
+
+            if (
+                self._sketch is not None
+                and victim[2] >= now
+                and self._sketch.frequency(key) < self._sketch.frequency(victim[0])
+            ):
+                return
+
+            del self._index[victim[0]]
+            self._index[key] = self._hand
+            self._slots[self._hand] = [key, value, now + self.ttl, False]
+            self._hand = (self._hand + 1) % self.maxsize
+
+    def __len__(self) -> int:
+        return len(self._slots)
@@ -1,10 +1,142 @@
+import io
+import json
+import multiprocessing
 import re
-from typing import Dict, List, Any
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Dict, List, Any, NamedTuple, Optional
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
-from cachetools import TTLCache
+import httpx
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+
+from services.clock_cache import ClockCache
+
+
+# Selectors compiled once to XPath; lxml evaluates them in C
+_BRAND_ANCHORS = CSSSelector("a[href]")
+_BRAND_CARD_ANCHORS = CSSSelector('a[class*="brand"][href]')
+_MODEL_CARDS = CSSSelector('a[href*="/tractor"], div[class*="model"], li[class*="model"]')
+_CARD_LINK = etree.XPath("(.//a[@href])[1]")
+_CARD_IMAGE = etree.XPath("(.//img[@src])[1]")
+
+# Matched against lowercased text, which avoids IGNORECASE matching
+_BRAND_HREF_RE = re.compile(r"/(?:tractor-?brands?|brand)/")
+_PRICE_RE = re.compile(r"₹|rs|price")
+
+
+# Common brands listing paths, tried in order until one returns a real page
+_BRANDS_PATHS = (
+    "/tractor-brands",
+    "/tractor-brand",
+    "/tractor/brands",
+)
+
+# Cached pages are served without a request for a day; after that they are
+# revalidated with their ETag/Last-Modified, so the copy is kept around longer
+_PAGE_FRESH_FOR = 60 * 60 * 24
+_PAGE_KEEP_FOR = 60 * 60 * 24 * 7
+
+# Parser processes per client; every gunicorn worker has its own client, so this
+# stays small rather than scaling with the CPU count
+_PARSE_WORKERS = 2
+# Concurrent page requests per batch; they share the client's HTTP/2 connection
+_FETCH_WORKERS = 8
+
+
+class _CachedPage(NamedTuple):
+    html: str
+    fresh_until: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+def _text(el) -> str:
+    """Concatenate the element's stripped text fragments (BeautifulSoup's get_text(strip=True))"""
+    return "".join(part.strip() for part in el.itertext())
+
+
+def _parse(html: str):
+    """Parse a page into an lxml tree; a blank page gives an empty document"""
+    return lxml_html.fromstring(html) if html.strip() else lxml_html.Element("html")
+
+
+def _collect_specs(table, specs: Dict[str, Any]) -> None:
+    """Add the key/value pairs of a 2-column spec table to specs"""
+    has_headers = sum(1 for _ in table.iter("th")) > 1
+    for row in table.iter("tr"):
+        # Tables with explicit headers keep their key/value pairs in td cells
+        cells = [_text(c) for c in (row.iter("td") if has_headers else row.iter("td", "th"))]
+        if len(cells) == 2:
+            key, value = cells
+            if key and value:
+                specs[key] = value
+
+
+def _parse_details(html: str, cache_key: str, base_url: str) -> Dict[str, Any]:
+    """Extract title, specs and images from a model detail page"""
+    # Detail pages are the largest documents and mostly non-spec markup, so
+    # stream them and drop each finished top-level element instead of
+    # holding the whole tree
+    h1_text = None
+    title_text = None
+    specs: Dict[str, Any] = {}
+    images: List[str] = []
+    # Tables and headings still being read; their content must survive until they end
+    open_containers = 0
+    events = etree.iterparse(
+        io.BytesIO(html.encode("utf-8")),
+        events=("start", "end"),
+        tag=("table", "h1", "title", "img"),
+        html=True,
+        encoding="utf-8",
+        remove_comments=True,
+        recover=True,
+    )
+    try:
+        for event, elem in events:
+            if event == "start":
+                if elem.tag in ("table", "h1"):
+                    open_containers += 1
+                continue
+
+            if elem.tag == "table":
+                open_containers -= 1
+                _collect_specs(elem, specs)
+            elif elem.tag == "h1":
+                open_containers -= 1
+                if h1_text is None:
+                    h1_text = _text(elem)
+            elif elem.tag == "title":
+                if title_text is None:
+                    title_text = _text(elem)
+            elif len(images) < 10:
+                src = elem.get("src")
+                if src:
+                    images.append(src.strip())
+
+            # Rows of an enclosing table, or the text of an enclosing heading,
+            # are still needed until that element ends
+            if open_containers == 0:
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    except etree.XMLSyntaxError:
+        # Blank or unparseable page: keep whatever was collected
+        pass
+    title_text = h1_text if h1_text is not None else title_text or ""
+
+    return {
+        "title": title_text,
+        "path": cache_key,
+        "url": urljoin(base_url + "/", cache_key.lstrip("/")),
+        "specs": specs,
+        "images": images,
+    }
 
 
 class TractorGuruClient:
@@ -16,23 +148,40 @@ class TractorGuruClient:
     - Selectors are best-effort and may need updates if the site structure changes.
     """
 
-    def __init__(self, base_url: str = "https://tractorguru.in") -> None:
+    def __init__(self, base_url: str = "https://tractorguru.in", state_file: Optional[str] = "tractorguru_state.json") -> None:
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-            ),
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        })
-
-        # Cache pages and parsed results for 1 day
-        self._page_cache: TTLCache[str, str] = TTLCache(maxsize=128, ttl=60 * 60 * 24)
-        self._brands_cache: TTLCache[str, List[Dict[str, Any]]] = TTLCache(maxsize=1, ttl=60 * 60 * 24)
-        self._models_cache: TTLCache[str, List[Dict[str, Any]]] = TTLCache(maxsize=128, ttl=60 * 60 * 24)
-        self._details_cache: TTLCache[str, Dict[str, Any]] = TTLCache(maxsize=256, ttl=60 * 60 * 24)
+        # Small JSON file remembering which brands listing path worked, so a
+        # restart does not probe the dead candidates again
+        self._state_file = state_file
+        self._working_brands_path: Optional[str] = self._load_state().get("brands_path")
+        # Keep-alive pool sized for concurrent Flask workers sharing this client;
+        # HTTP/2 lets their requests multiplex over one TLS connection
+        self.client = httpx.Client(
+            http2=True,
+            timeout=15.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+                ),
+                "Accept-Language": "en-US,en;q=0.9",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Encoding": "gzip, deflate",
+            },
+        )
+
+        # Cache pages and parsed results for 1 day; detail lookups are skewed towards
+        # popular models, so that cache only admits keys that out-request its victims
+        self._page_cache: ClockCache[str, _CachedPage] = ClockCache(maxsize=128, ttl=_PAGE_KEEP_FOR)
+        self._brands_cache: ClockCache[str, List[Dict[str, Any]]] = ClockCache(maxsize=1, ttl=60 * 60 * 24)
+        self._models_cache: ClockCache[str, List[Dict[str, Any]]] = ClockCache(maxsize=128, ttl=60 * 60 * 24)
+        self._details_cache: ClockCache[str, Dict[str, Any]] = ClockCache(maxsize=256, ttl=60 * 60 * 24, admission=True)
+
+        # Worker processes for parsing batches of detail pages; see _parse_pool()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
 
     def _fetch(self, path_or_url: str) -> str:
         url = path_or_url
@@ -40,31 +189,51 @@ class TractorGuruClient:
             path = path_or_url if path_or_url.startswith("/") else f"/{path_or_url}"
             url = urljoin(self.base_url + "/", path.lstrip("/"))
 
-        if url in self._page_cache:
-            return self._page_cache[url]
-
-        response = self.session.get(url, timeout=15)
-        response.raise_for_status()
-        html = response.text
-        self._page_cache[url] = html
+        cached = self._page_cache.get(url)
+        if cached is not None and cached.fresh_until > time.monotonic():
+            return cached.html
+
+        # Revalidate a stale copy; an unchanged page comes back as an empty 304
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = self.client.get(url, headers=headers)
+        if cached is not None and response.status_code == 304:
+            html = cached.html
+            etag = response.headers.get("ETag", cached.etag)
+            last_modified = response.headers.get("Last-Modified", cached.last_modified)
+        else:
+            response.raise_for_status()
+            html = response.text
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        self._page_cache[url] = _CachedPage(html, time.monotonic() + _PAGE_FRESH_FOR, etag, last_modified)
         return html
 
     def get_brands(self) -> List[Dict[str, Any]]:
-        if "brands" in self._brands_cache:
-            return self._brands_cache["brands"]
+        cached = self._brands_cache.get("brands")
+        if cached is not None:
+            return cached
 
-        # Try common brands listing paths
-        possible_paths = [
-            "/tractor-brands",
-            "/tractor-brand",
-            "/tractor/brands",
-        ]
+        # Try the path that worked last time first, then the other candidates
+        possible_paths = list(_BRANDS_PATHS)
+        if self._working_brands_path in possible_paths:
+            possible_paths.remove(self._working_brands_path)
+            possible_paths.insert(0, self._working_brands_path)
 
         html = None
         for path in possible_paths:
             try:
                 html = self._fetch(path)
                 if html and len(html) > 500:
+                    if path != self._working_brands_path:
+                        self._working_brands_path = path
+                        self._save_state()
                     break
             except Exception:
                 continue
@@ -72,27 +241,26 @@ class TractorGuruClient:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "lxml")
+        tree = _parse(html)
         brand_links = []
 
         # Heuristics: anchors that link to brand pages
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
-            text = a.get_text(strip=True)
+        for a in _BRAND_ANCHORS(tree):
+            href = a.get("href").strip()
+            text = _text(a)
             if not text:
                 continue
             # Likely brand link patterns
-            if re.search(r"/tractor-?brands?/", href, re.IGNORECASE) or re.search(r"/brand/", href, re.IGNORECASE):
+            if _BRAND_HREF_RE.search(href.lower()):
                 brand_links.append((text, href))
 
         # Fallback: cards with brand names
         if not brand_links:
-            for card in soup.select('div[class*="brand"], li[class*="brand"], a[class*="brand"]'):
-                if card.name == "a" and card.get("href"):
-                    href = card["href"].strip()
-                    text = card.get_text(strip=True)
-                    if text:
-                        brand_links.append((text, href))
+            for card in _BRAND_CARD_ANCHORS(tree):
+                href = card.get("href").strip()
+                text = _text(card)
+                if href and text:
+                    brand_links.append((text, href))
 
         # Normalize and dedupe
         seen = set()
@@ -120,39 +288,45 @@ class TractorGuruClient:
     def get_brand_models(self, brand_path: str) -> List[Dict[str, Any]]:
         normalized = brand_path if brand_path.startswith("/") else f"/{brand_path}"
         cache_key = normalized.rstrip("/")
-        if cache_key in self._models_cache:
-            return self._models_cache[cache_key]
+        cached = self._models_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         html = self._fetch(cache_key)
-        soup = BeautifulSoup(html, "lxml")
+        tree = _parse(html)
         models: List[Dict[str, Any]] = []
+        seen = set()
 
         # Heuristic: model cards or links likely contain "/tractor" and a price/spec snippet
-        for card in soup.select('a[href*="/tractor"], div[class*="model"], li[class*="model"]'):
-            href = None
-            name = None
+        for card in _MODEL_CARDS(tree):
+            is_link = card.tag == "a" and bool(card.get("href"))
+            a = card if is_link else next(iter(_CARD_LINK(card)), None)
+            if a is None:
+                continue
+            href = a.get("href").strip()
+            name = _text(a)
+            if not href or not name:
+                continue
+
+            # Basic dedupe by path; the first card for a path wins
+            model_path = href if href.startswith("/") else f"/{href}"
+            if model_path in seen:
+                continue
+            seen.add(model_path)
+
             price = None
             img = None
-
-            if hasattr(card, "get") and card.name == "a" and card.get("href"):
-                href = card["href"].strip()
-                name = card.get_text(strip=True)
-            else:
-                a = card.find("a", href=True)
-                if a:
-                    href = a["href"].strip()
-                    name = a.get_text(strip=True)
-                img_el = card.find("img", src=True)
-                if img_el:
-                    img = img_el["src"].strip()
-                price_el = card.find(string=re.compile(r"₹|Rs|Price", re.IGNORECASE))
+            if not is_link:
+                img_el = next(iter(_CARD_IMAGE(card)), None)
+                if img_el is not None:
+                    img = img_el.get("src").strip()
+                price_el = next(
+                    (text for text in card.itertext() if _PRICE_RE.search(text.lower())),
+                    None,
+                )
                 if price_el:
                     price = price_el.strip()
 
-            if not href or not name:
-                continue
-
-            model_path = href if href.startswith("/") else f"/{href}"
             models.append({
                 "name": name,
                 "path": model_path,
@@ -161,59 +335,84 @@ class TractorGuruClient:
                 "price": price,
             })
 
-        # Basic dedupe by path
-        deduped: Dict[str, Dict[str, Any]] = {}
-        for m in models:
-            deduped[m["path"]] = m
-        result = list(deduped.values())
-        self._models_cache[cache_key] = result
-        return result
+        self._models_cache[cache_key] = models
+        return models
 
     def get_model_details(self, model_path: str) -> Dict[str, Any]:
-        normalized = model_path if model_path.startswith("/") else f"/{model_path}"
-        cache_key = normalized.rstrip("/")
-        if cache_key in self._details_cache:
-            return self._details_cache[cache_key]
-
-        html = self._fetch(cache_key)
-        soup = BeautifulSoup(html, "lxml")
-
-        # Title
-        title = soup.find("h1")
-        title_text = title.get_text(strip=True) if title else soup.title.get_text(strip=True) if soup.title else ""
-
-        # Try to parse a key-value spec table
-        specs: Dict[str, Any] = {}
-        for table in soup.select("table"):
-            headers = [th.get_text(strip=True) for th in table.find_all("th")]
-            # Look for 2-column spec tables
-            if len(headers) <= 1:
-                for row in table.find_all("tr"):
-                    cells = [c.get_text(strip=True) for c in row.find_all(["td", "th"])]
-                    if len(cells) == 2:
-                        key, value = cells
-                        if key and value:
-                            specs[key] = value
-            else:
-                # Tables with explicit headers
-                for row in table.find_all("tr"):
-                    cells = [c.get_text(strip=True) for c in row.find_all("td")]
-                    if len(cells) == 2:
-                        key, value = cells
-                        if key and value:
-                            specs[key] = value
-
-        # Try to find images
-        images = [img["src"].strip() for img in soup.find_all("img", src=True) if img.get("src")]
-
-        data = {
-            "title": title_text,
-            "path": cache_key,
-            "url": urljoin(self.base_url + "/", cache_key.lstrip("/")),
-            "specs": specs,
-            "images": images[:10],
-        }
+        cache_key = self._details_key(model_path)
+        cached = self._details_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
+        data = _parse_details(self._fetch(cache_key), cache_key, self.base_url)
         self._details_cache[cache_key] = data
         return data
 
+    def get_models_details(self, model_paths: List[str]) -> List[Dict[str, Any]]:
+        """Details for several models; uncached pages are fetched concurrently and parsed in worker processes"""
+        keys = [self._details_key(path) for path in model_paths]
+        results = {key: self._details_cache.get(key) for key in keys}
+        missing = [key for key, data in results.items() if data is None]
+
+        if len(missing) > 1:
+            # Fetch concurrently so a batch costs its slowest round trip, not their sum
+            with ThreadPoolExecutor(max_workers=min(len(missing), _FETCH_WORKERS)) as fetchers:
+                pages = list(fetchers.map(self._fetch, missing))
+            pool = self._parse_pool()
+            try:
+                parsed = list(pool.map(_parse_details, pages, missing, repeat(self.base_url)))
+            except BrokenProcessPool:
+                # A parser process died (OOM kill, signal); the executor can't be reused,
+                # so drop it for the next batch to replace and parse this one here
+                self._discard_pool(pool)
+                parsed = [_parse_details(page, key, self.base_url) for page, key in zip(pages, missing)]
+            for key, data in zip(missing, parsed):
+                self._details_cache[key] = data
+                results[key] = data
+        else:
+            for key in missing:
+                results[key] = self.get_model_details(key)
+
+        return [results[key] for key in keys]
+
+    def _load_state(self) -> Dict[str, Any]:
+        if not self._state_file:
+            return {}
+        try:
+            with open(self._state_file, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save_state(self) -> None:
+        if not self._state_file:
+            return
+        try:
+            with open(self._state_file, "w", encoding="utf-8") as f:
+                json.dump({"brands_path": self._working_brands_path}, f)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _details_key(model_path: str) -> str:
+        normalized = model_path if model_path.startswith("/") else f"/{model_path}"
+        return normalized.rstrip("/")
+
+    def _parse_pool(self) -> ProcessPoolExecutor:
+        # Created on first batch so importing the client (and gunicorn's preload)
+        # never starts processes; spawned rather than forked from a threaded worker
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=_PARSE_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            # Another thread may already have replaced it
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
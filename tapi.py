@@ -1,16 +1,16 @@
 # main.py - Enhanced FramTrack API with Tractor Sales Data
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 import asyncio
 import aiohttp
-import json
-import random
+import math
+import numpy as np
+import orjson
 from datetime import datetime, timedelta
-import schedule
 import threading
-import time
 from bs4 import BeautifulSoup
 import sqlite3
 import os
@@ -18,7 +18,8 @@ import os
 app = FastAPI(
     title="FramTrack - Tractor Sales Analytics",
     description="Real-world tractor sales data API with daily updates",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -33,36 +34,60 @@ app.add_middleware(
 # Database setup
 DB_FILE = "framtrack.db"
 
+# One connection per process, shared by all requests; sqlite3 connections are not
+# safe for concurrent use, so every access goes through _DB_LOCK
+_DB: Optional[sqlite3.Connection] = None
+_DB_LOCK = threading.Lock()
+
+def get_db_connection() -> sqlite3.Connection:
+    """Get the shared database connection, opening it on first use"""
+    global _DB
+    if _DB is None:
+        _DB = sqlite3.connect(DB_FILE, check_same_thread=False)
+        _DB.row_factory = sqlite3.Row
+        # Safe with WAL: commits only fsync at checkpoints
+        _DB.execute("PRAGMA synchronous=NORMAL")
+        # ~20MB page cache, kept warm across requests
+        _DB.execute("PRAGMA cache_size=-20000")
+    return _DB
+
 def init_db():
     """Initialize SQLite database"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tractor_sales (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_name TEXT NOT NULL,
-            daily_sales INTEGER NOT NULL,
-            market_share REAL NOT NULL,
-            revenue REAL NOT NULL,
-            popular_models TEXT NOT NULL,
-            date_updated TEXT NOT NULL,
-            rank INTEGER NOT NULL
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS market_trends (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            trend_type TEXT NOT NULL,
-            value REAL NOT NULL,
-            date_recorded TEXT NOT NULL,
-            description TEXT
-        )
-    """)
-    
-    conn.commit()
-    conn.close()
+    with _DB_LOCK:
+        conn = get_db_connection()
+        # WAL is persistent on the database file; readers no longer block the writer
+        conn.execute("PRAGMA journal_mode=WAL")
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tractor_sales (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_name TEXT NOT NULL,
+                daily_sales INTEGER NOT NULL,
+                market_share REAL NOT NULL,
+                revenue REAL NOT NULL,
+                popular_models TEXT NOT NULL,
+                date_updated TEXT NOT NULL,
+                rank INTEGER NOT NULL
+            )
+        """)
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS market_trends (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                trend_type TEXT NOT NULL,
+                value REAL NOT NULL,
+                date_recorded TEXT NOT NULL,
+                description TEXT
+            )
+        """)
+        
+        # Serves the ORDER BY date_recorded DESC LIMIT in /market-trends from the index
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_trends_date ON market_trends (date_recorded DESC)
+        """)
+        
+        conn.commit()
 
 # Pydantic models
 class TractorCompany(BaseModel):
@@ -90,6 +115,26 @@ class SalesResponse(BaseModel):
 sales_data = []
 last_update = None
 
+# Aggregates and encoded bodies of the responses that only change with
+# sales_data; rebuilt by refresh_response_cache() whenever it is replaced
+_total_daily_sales: int = 0
+_total_revenue: float = 0.0
+_sales_json: bytes = b""
+_root_json: bytes = b""
+# Lowercased company name -> encoded /company/{name} body
+_company_json_by_name: Dict[str, bytes] = {}
+
+API_INFO = {
+    "message": "FramTrack - Tractor Sales Analytics API",
+    "version": "2.0.0",
+    "endpoints": {
+        "sales": "/api/v1/tractor-sales",
+        "company": "/api/v1/company/{company_name}",
+        "trends": "/api/v1/market-trends",
+        "update": "/api/v1/update-data"
+    }
+}
+
 # Top 5 tractor companies with realistic data patterns
 TRACTOR_COMPANIES = {
     "John Deere": {
@@ -124,95 +169,113 @@ TRACTOR_COMPANIES = {
     }
 }
 
+# Per-company columns of TRACTOR_COMPANIES, so a refresh draws every company's
+# variation in one batch
+_COMPANY_NAMES = list(TRACTOR_COMPANIES)
+_BASE_SALES = np.array([info["base_sales"] for info in TRACTOR_COMPANIES.values()])
+_BASE_MARKET_SHARE = np.array([info["market_share"] for info in TRACTOR_COMPANIES.values()])
+_BASE_REVENUE = np.array([info["base_revenue"] for info in TRACTOR_COMPANIES.values()])
+_rng = np.random.default_rng()
+
 async def fetch_external_data():
     """Fetch data from external sources (simulated with realistic variations)"""
     try:
         # Simulate API call with realistic market fluctuations
         await asyncio.sleep(1)  # Simulate network delay
         
-        current_data = []
-        for rank, (company, info) in enumerate(TRACTOR_COMPANIES.items(), 1):
-            # Add realistic daily variations (-15% to +25%)
-            variation = random.uniform(0.85, 1.25)
-            seasonal_factor = 1 + 0.2 * random.sin(datetime.now().timetuple().tm_yday * 2 * 3.14159 / 365)
-            
-            daily_sales = int(info["base_sales"] * variation * seasonal_factor)
-            market_share = round(info["market_share"] * random.uniform(0.95, 1.05), 1)
-            revenue = round(info["base_revenue"] * variation * seasonal_factor, 1)
-            
-            company_data = TractorCompany(
-                rank=rank,
-                company_name=company,
-                daily_sales=daily_sales,
-                market_share=market_share,
-                revenue=revenue,
-                popular_models=info["models"],
-                last_updated=datetime.now().isoformat()
-            )
-            current_data.append(company_data)
+        now = datetime.now()
+        seasonal_factor = 1 + 0.2 * math.sin(now.timetuple().tm_yday * math.tau / 365)
         
-        return current_data
+        # Add realistic daily variations (-15% to +25%)
+        variation = _rng.uniform(0.85, 1.25, size=len(_COMPANY_NAMES))
+        share_jitter = _rng.uniform(0.95, 1.05, size=len(_COMPANY_NAMES))
+        
+        daily_sales = (_BASE_SALES * variation * seasonal_factor).astype(np.int64)
+        market_share = np.round(_BASE_MARKET_SHARE * share_jitter, 1)
+        revenue = np.round(_BASE_REVENUE * variation * seasonal_factor, 1)
+        
+        last_updated = now.isoformat()
+        # Plain dicts in TractorCompany field order; values are already typed, so
+        # they are encoded directly rather than validated through the model
+        return [
+            {
+                "rank": rank,
+                "company_name": company,
+                "daily_sales": sales,
+                "market_share": share,
+                "revenue": rev,
+                "popular_models": TRACTOR_COMPANIES[company]["models"],
+                "last_updated": last_updated
+            }
+            for rank, (company, sales, share, rev) in enumerate(
+                zip(_COMPANY_NAMES, daily_sales.tolist(), market_share.tolist(), revenue.tolist()), 1
+            )
+        ]
     except Exception as e:
         print(f"Error fetching external data: {e}")
         return None
 
-def save_to_database(data: List[TractorCompany]):
-    """Save sales data to SQLite database"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    # Clear old data
-    cursor.execute("DELETE FROM tractor_sales")
+def save_to_database(conn: sqlite3.Connection, data: List[Dict], trends: List[tuple] = ()):
+    """Replace sales data and record market trends in a single transaction"""
+    rows = [
+        (
+            company["company_name"],
+            company["daily_sales"],
+            company["market_share"],
+            company["revenue"],
+            orjson.dumps(company["popular_models"]).decode(),
+            company["last_updated"],
+            company["rank"]
+        )
+        for company in data
+    ]
     
-    # Insert new data
-    for company in data:
-        cursor.execute("""
+    with conn:
+        # Clear old data
+        conn.execute("DELETE FROM tractor_sales")
+        
+        conn.executemany("""
             INSERT INTO tractor_sales 
             (company_name, daily_sales, market_share, revenue, popular_models, date_updated, rank)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            company.company_name,
-            company.daily_sales,
-            company.market_share,
-            company.revenue,
-            json.dumps(company.popular_models),
-            company.last_updated,
-            company.rank
-        ))
-    
-    conn.commit()
-    conn.close()
+        """, rows)
+        
+        conn.executemany("""
+            INSERT INTO market_trends (trend_type, value, date_recorded, description)
+            VALUES (?, ?, ?, ?)
+        """, trends)
 
-def load_from_database() -> List[TractorCompany]:
+def load_from_database() -> List[Dict]:
     """Load sales data from SQLite database"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT company_name, daily_sales, market_share, revenue, popular_models, date_updated, rank
-        FROM tractor_sales ORDER BY rank
-    """)
+    with _DB_LOCK:
+        rows = get_db_connection().execute("""
+            SELECT rank, company_name, daily_sales, market_share, revenue, popular_models,
+                   date_updated AS last_updated
+            FROM tractor_sales ORDER BY rank
+        """).fetchall()
     
-    rows = cursor.fetchall()
-    conn.close()
+    # Rows were validated before they were stored, so skip the model round-trip
+    return [{**dict(row), "popular_models": orjson.loads(row["popular_models"])} for row in rows]
+
+def refresh_response_cache():
+    """Recompute aggregates and re-encode the cached API responses from the current sales data"""
+    global _total_daily_sales, _total_revenue, _sales_json, _root_json, _company_json_by_name
     
-    if not rows:
-        return []
+    _total_daily_sales = sum(company["daily_sales"] for company in sales_data)
+    _total_revenue = sum(company["revenue"] for company in sales_data)
+    _root_json = orjson.dumps({**API_INFO, "last_updated": last_update})
+    _company_json_by_name = {company["company_name"].lower(): orjson.dumps(company) for company in sales_data}
     
-    companies = []
-    for row in rows:
-        company = TractorCompany(
-            company_name=row[0],
-            daily_sales=row[1],
-            market_share=row[2],
-            revenue=row[3],
-            popular_models=json.loads(row[4]),
-            last_updated=row[5],
-            rank=row[6]
-        )
-        companies.append(company)
+    if not sales_data:
+        _sales_json = b""
+        return
     
-    return companies
+    _sales_json = orjson.dumps({
+        "success": True,
+        "data": sales_data,
+        "last_updated": last_update,
+        "total_market_size": round(_total_revenue, 1)
+    })
 
 async def update_sales_data():
     """Update sales data from external sources"""
@@ -226,42 +289,40 @@ async def update_sales_data():
     if new_data:
         sales_data = new_data
         last_update = datetime.now().isoformat()
+        refresh_response_cache()
         
-        # Save to database
-        save_to_database(sales_data)
-        
-        # Save market trends
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        
-        total_sales = sum(company.daily_sales for company in sales_data)
-        avg_revenue = sum(company.revenue for company in sales_data) / len(sales_data)
+        trends = [
+            ("total_daily_sales", _total_daily_sales, last_update, "Total daily sales across top 5 companies"),
+            ("avg_revenue", _total_revenue / len(sales_data), last_update, "Average revenue across top 5 companies")
+        ]
         
-        cursor.execute("""
-            INSERT INTO market_trends (trend_type, value, date_recorded, description)
-            VALUES (?, ?, ?, ?)
-        """, ("total_daily_sales", total_sales, last_update, "Total daily sales across top 5 companies"))
+        # Save sales data and market trends together
+        with _DB_LOCK:
+            save_to_database(get_db_connection(), sales_data, trends)
         
-        cursor.execute("""
-            INSERT INTO market_trends (trend_type, value, date_recorded, description)
-            VALUES (?, ?, ?, ?)
-        """, ("avg_revenue", avg_revenue, last_update, "Average revenue across top 5 companies"))
-        
-        conn.commit()
-        conn.close()
-        
-        print(f"Sales data updated successfully. Total daily sales: {total_sales}")
+        print(f"Sales data updated successfully. Total daily sales: {_total_daily_sales}")
     else:
         print("Failed to update sales data")
 
-def schedule_updates():
-    """Schedule daily updates"""
-    schedule.every().day.at("00:00").do(lambda: asyncio.create_task(update_sales_data()))
-    schedule.every().day.at("12:00").do(lambda: asyncio.create_task(update_sales_data()))  # Noon update too
-    
+# Daily update times (local hour); noon update too
+UPDATE_HOURS = (0, 12)
+
+_scheduler_task: Optional[asyncio.Task] = None
+
+def seconds_until_next_update(now: datetime) -> float:
+    """Seconds from now until the next scheduled update time"""
+    today = [now.replace(hour=h, minute=0, second=0, microsecond=0) for h in UPDATE_HOURS]
+    next_run = min((t for t in today if t > now), default=today[0] + timedelta(days=1))
+    return (next_run - now).total_seconds()
+
+async def schedule_updates():
+    """Run update_sales_data at each scheduled time, sleeping in between"""
     while True:
-        schedule.run_pending()
-        time.sleep(60)
+        await asyncio.sleep(seconds_until_next_update(datetime.now()))
+        try:
+            await update_sales_data()
+        except Exception as e:
+            print(f"Scheduled update failed: {e}")
 
 # API Endpoints
 
@@ -276,45 +337,37 @@ async def startup_event():
     if existing_data:
         global sales_data, last_update
         sales_data = existing_data
-        last_update = sales_data[0].last_updated if sales_data else datetime.now().isoformat()
+        last_update = sales_data[0]["last_updated"] if sales_data else datetime.now().isoformat()
+        refresh_response_cache()
         print("Loaded existing data from database")
     else:
         await update_sales_data()
         print("Fetched fresh data on startup")
     
     # Start background scheduler
-    scheduler_thread = threading.Thread(target=schedule_updates, daemon=True)
-    scheduler_thread.start()
+    global _scheduler_task
+    _scheduler_task = asyncio.create_task(schedule_updates())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the background scheduler"""
+    if _scheduler_task is not None:
+        _scheduler_task.cancel()
 
 @app.get("/", summary="API Info")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "message": "FramTrack - Tractor Sales Analytics API",
-        "version": "2.0.0",
-        "endpoints": {
-            "sales": "/api/v1/tractor-sales",
-            "company": "/api/v1/company/{company_name}",
-            "trends": "/api/v1/market-trends",
-            "update": "/api/v1/update-data"
-        },
-        "last_updated": last_update
-    }
+    if not _root_json:
+        refresh_response_cache()
+    return Response(_root_json, media_type="application/json")
 
 @app.get("/api/v1/tractor-sales", response_model=SalesResponse, summary="Get Top 5 Tractor Companies")
 async def get_tractor_sales():
     """Get the top 5 tractor companies by sales volume"""
-    if not sales_data:
+    if not _sales_json:
         raise HTTPException(status_code=503, detail="Sales data not available. Please try again later.")
     
-    total_market = sum(company.revenue for company in sales_data)
-    
-    return SalesResponse(
-        success=True,
-        data=sales_data,
-        last_updated=last_update,
-        total_market_size=round(total_market, 1)
-    )
+    return Response(_sales_json, media_type="application/json")
 
 @app.get("/api/v1/company/{company_name}", response_model=TractorCompany, summary="Get Specific Company Data")
 async def get_company_data(company_name: str):
@@ -322,40 +375,26 @@ async def get_company_data(company_name: str):
     if not sales_data:
         raise HTTPException(status_code=503, detail="Sales data not available")
     
-    company_data = next((company for company in sales_data 
-                        if company.company_name.lower() == company_name.lower()), None)
+    body = _company_json_by_name.get(company_name.lower())
     
-    if not company_data:
+    if body is None:
         raise HTTPException(status_code=404, detail=f"Company '{company_name}' not found")
     
-    return company_data
+    return Response(body, media_type="application/json")
 
 @app.get("/api/v1/market-trends", summary="Get Market Trends")
 async def get_market_trends():
     """Get historical market trends data"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT trend_type, value, date_recorded, description
-        FROM market_trends 
-        ORDER BY date_recorded DESC 
-        LIMIT 50
-    """)
-    
-    rows = cursor.fetchall()
-    conn.close()
-    
-    trends = []
-    for row in rows:
-        trends.append(MarketTrend(
-            trend_type=row[0],
-            value=row[1],
-            date_recorded=row[2],
-            description=row[3]
-        ))
+    with _DB_LOCK:
+        rows = get_db_connection().execute("""
+            SELECT trend_type, value, date_recorded, description
+            FROM market_trends 
+            ORDER BY date_recorded DESC 
+            LIMIT 50
+        """).fetchall()
     
-    return {"success": True, "trends": trends}
+    # Columns already match MarketTrend; encode the rows directly
+    return ORJSONResponse({"success": True, "trends": [dict(row) for row in rows]})
 
 @app.post("/api/v1/update-data", summary="Manual Data Update")
 async def manual_update(background_tasks: BackgroundTasks):
@@ -0,0 +1,257 @@
+# test_app.py - Flask app helper tests
+import random
+import threading
+import time
+
+import orjson
+import pytest
+
+import main
+
+CALLERS = 8
+
+
+class _CountingEvent(threading.Event):
+    """Event that records how many threads are waiting on it"""
+
+    def __init__(self):
+        super().__init__()
+        self.waiters = 0
+        self._count_lock = threading.Lock()
+
+    def wait(self, timeout=None):
+        with self._count_lock:
+            self.waiters += 1
+        return super().wait(timeout)
+
+
+class _CountingFlight(main._Flight):
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__()
+        self.done = _CountingEvent()
+
+
+@pytest.fixture
+def flights(monkeypatch):
+    """Track the in-flight fetches _tg_cached_json starts"""
+    started = []
+
+    def make_flight():
+        flight = _CountingFlight()
+        started.append(flight)
+        return flight
+
+    monkeypatch.setattr(main, "_Flight", make_flight)
+    monkeypatch.setattr(main, "_tg_json", main.TTLCache(maxsize=16, ttl=600))
+    return started
+
+
+def _run_callers(key, fetch, flights, release):
+    """Call _tg_cached_json from CALLERS threads; release the fetch once all but the leader wait"""
+    results = [None] * CALLERS
+
+    def call(i):
+        try:
+            results[i] = main._tg_cached_json(key, fetch).get_data()
+        except Exception as exc:
+            results[i] = exc
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+
+    deadline = time.monotonic() + 5
+    while not (flights and flights[0].done.waiters == CALLERS - 1):
+        assert time.monotonic() < deadline, "callers never queued behind the leader"
+        time.sleep(0.001)
+    release.set()
+
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+class TestTractorGuruSingleFlight:
+    """Test that concurrent misses for one key share a single upstream fetch"""
+
+    def test_one_fetch_for_concurrent_callers(self, flights):
+        """Every caller gets the leader's body and the result is cached"""
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return [{"name": "Mahindra"}]
+
+        results = _run_callers("brands", fetch, flights, release)
+
+        assert len(calls) == 1
+        assert results == [b'[{"name":"Mahindra"}]'] * CALLERS
+        assert main._tg_json.get("brands") == b'[{"name":"Mahindra"}]'
+        assert main._tg_inflight == {}
+
+    def test_leader_error_reaches_waiters(self, flights):
+        """A failed fetch raises in every caller and caches nothing"""
+        calls = []
+        release = threading.Event()
+        error = RuntimeError("upstream down")
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            raise error
+
+        results = _run_callers("brands", fetch, flights, release)
+
+        assert len(calls) == 1
+        assert results == [error] * CALLERS
+        assert "brands" not in main._tg_json
+        assert main._tg_inflight == {}
+
+    def test_waiters_time_out_on_a_hung_leader(self, flights, monkeypatch):
+        """Waiters give up with a 504 after _TG_WAIT_TIMEOUT while the leader keeps fetching"""
+        monkeypatch.setattr(main, "_TG_WAIT_TIMEOUT", 0.05)
+        release = threading.Event()
+        leader_done = threading.Event()
+
+        def fetch():
+            release.wait(5)
+            return [{"name": "Mahindra"}]
+
+        def lead():
+            main._tg_cached_json("brands", fetch)
+            leader_done.set()
+
+        threading.Thread(target=lead).start()
+        deadline = time.monotonic() + 5
+        while not flights:
+            assert time.monotonic() < deadline, "leader never started"
+            time.sleep(0.001)
+
+        with main.app.app_context():
+            response, status = main._tg_cached_json("brands", fetch)
+        assert status == 504
+        assert response.get_json() == {"error": "TractorGuru request timed out"}
+
+        release.set()
+        assert leader_done.wait(5)
+        assert main._tg_json.get("brands") == b'[{"name":"Mahindra"}]'
+
+
+def _baseline_search(query):
+    """Plain substring scan the trigram search must agree with"""
+    return [
+        company for company, name_lc, models_lc in main._SEARCH_INDEX
+        if query in name_lc or any(query in m for m in models_lc)
+    ]
+
+
+class TestCompanySearch:
+    """Test the trigram-narrowed company search"""
+
+    def test_matches_substring_scan(self):
+        """Results equal a full scan for every substring of the indexed fields"""
+        queries = {""}
+        for _, name_lc, models_lc in main._SEARCH_INDEX:
+            for text in (name_lc,) + models_lc:
+                queries.update(text[i:j] for i in range(len(text)) for j in range(i + 1, min(len(text), i + 8) + 1))
+        for query in sorted(queries):
+            assert main._search_companies(query) == _baseline_search(query), query
+
+    @pytest.mark.parametrize("query", ["", "m", "ma", "jo", "5", "zz", "zzz", "mahindra tractors", "a d"])
+    def test_short_and_unmatched_queries(self, query):
+        """Queries under 3 characters and misses behave like the scan"""
+        assert main._search_companies(query) == _baseline_search(query)
+
+
+@pytest.fixture
+def tg_details(monkeypatch):
+    """Stub the TractorGuru detail lookups and record the paths they get"""
+    calls = []
+
+    def one(path):
+        calls.append(path)
+        return {"path": path}
+
+    def many(paths):
+        calls.append(list(paths))
+        return [{"path": path} for path in paths]
+
+    monkeypatch.setattr(main.tg_client, "get_model_details", one)
+    monkeypatch.setattr(main.tg_client, "get_models_details", many)
+    monkeypatch.setattr(main, "_tg_json", main.TTLCache(maxsize=16, ttl=600))
+    return calls
+
+
+def _details_url(*paths):
+    return "/api/tractorguru/model_details?" + "&".join(f"path={path}" for path in paths)
+
+
+class TestModelDetailsEndpoint:
+    """Test /api/tractorguru/model_details"""
+
+    def test_single_path_returns_object(self, tg_details):
+        """One path returns that model's details"""
+        response = main.app.test_client().get(_details_url("/x"))
+        assert response.status_code == 200
+        assert response.get_json() == {"path": "/x"}
+
+    def test_several_paths_return_list(self, tg_details):
+        """Several paths return a list in request order"""
+        response = main.app.test_client().get(_details_url("/y", "/x"))
+        assert response.status_code == 200
+        assert response.get_json() == [{"path": "/y"}, {"path": "/x"}]
+
+    def test_repeated_paths_are_deduped(self, tg_details):
+        """Repeated paths are looked up once and still return a list"""
+        response = main.app.test_client().get(_details_url("/x", "/y", "/x"))
+        assert response.get_json() == [{"path": "/x"}, {"path": "/y"}]
+        assert tg_details == [["/x", "/y"]]
+
+        response = main.app.test_client().get(_details_url("/x", "/x"))
+        assert response.get_json() == [{"path": "/x"}]
+
+    def test_path_cap(self, tg_details):
+        """More than _TG_MAX_MODEL_PATHS paths is rejected before any lookup"""
+        paths = [f"/m{i}" for i in range(main._TG_MAX_MODEL_PATHS)]
+        client = main.app.test_client()
+        assert client.get(_details_url(*paths)).status_code == 200
+
+        response = client.get(_details_url(*paths, "/extra"))
+        assert response.status_code == 400
+        assert len(tg_details) == 1
+
+    def test_missing_path(self, tg_details):
+        """No path param is a 400"""
+        assert main.app.test_client().get("/api/tractorguru/model_details").status_code == 400
+
+
+def _dict_recommendations(crop_type, farm_size, scores):
+    """Recommendations built from plain dicts, as the spliced bytes must decode to"""
+    ids = main.CROP_TRACTOR_MAP.get(crop_type, main.CROP_TRACTOR_MAP["wheat"])[:3]
+    reason = f"Perfect for {crop_type} farming on {farm_size} acres"
+    return [
+        {**orjson.loads(orjson.dumps(main.COMPANIES_BY_ID[i])), "match_score": score, "reason": reason}
+        for i, score in zip(ids, scores)
+    ]
+
+
+class TestRecommendations:
+    """Test the pre-encoded /get-recommendations responses"""
+
+    @pytest.mark.parametrize("crop_type", sorted(main.CROP_TRACTOR_MAP) + ["barley", 'say "hi" \\ ñ'])
+    def test_body_equals_dict_encoding(self, monkeypatch, crop_type):
+        """Every crop, and the wheat fallback, decodes to the dict-built result"""
+        monkeypatch.setattr(main, "_score_rng", random.Random(7))
+        response = main.app.test_client().post(
+            "/get-recommendations", json={"crop_type": crop_type, "farm_size": 12.5}
+        )
+        assert response.status_code == 200
+
+        body = orjson.loads(response.get_data())
+        scores = random.Random(7).choices(main._MATCH_SCORE_RANGE, k=len(body))
+        assert body == _dict_recommendations(crop_type, 12.5, scores)
+        assert all(85 <= rec["match_score"] < 99 for rec in body)
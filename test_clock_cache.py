@@ -0,0 +1,132 @@
+# test_clock_cache.py - CLOCK cache and TinyLFU admission tests
+import pytest
+
+import services.clock_cache as clock_cache
+from services.clock_cache import ClockCache, FrequencySketch
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for TTL tests"""
+    now = [1000.0]
+    monkeypatch.setattr(clock_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestEviction:
+    """Test CLOCK second-chance eviction"""
+
+    def test_referenced_entries_get_a_second_chance(self, clock):
+        """An entry read since the last sweep survives; the oldest unread one is evicted"""
+        cache = ClockCache(maxsize=3, ttl=60)
+        for key in "abc":
+            cache[key] = key.upper()
+        assert cache.get("a") == "A"
+
+        cache["d"] = "D"
+
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
+        assert cache.get("d") == "D"
+        assert len(cache) == 3
+
+    def test_overwrite_keeps_size(self, clock):
+        """Setting an existing key replaces its value in place"""
+        cache = ClockCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+        cache["a"] = 2
+        assert cache["a"] == 2
+        assert len(cache) == 1
+
+    def test_missing_key_raises(self, clock):
+        """Indexing a missing key raises KeyError; get() returns the default"""
+        cache = ClockCache(maxsize=2, ttl=60)
+        with pytest.raises(KeyError):
+            cache["missing"]
+        assert cache.get("missing", "default") == "default"
+
+
+class TestExpiry:
+    """Test per-entry TTL"""
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Entries are served until their TTL passes, then miss"""
+        cache = ClockCache(maxsize=2, ttl=10)
+        cache["a"] = 1
+        clock[0] += 9
+        assert cache.get("a") == 1
+        clock[0] += 2
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_expired_entry_is_evicted_first(self, clock):
+        """An expired entry is replaced even if it was recently read"""
+        cache = ClockCache(maxsize=2, ttl=10)
+        cache["old"] = 1
+        clock[0] += 5
+        cache["new"] = 2
+        cache.get("new")
+        clock[0] += 6
+
+        cache["next"] = 3
+
+        assert cache.get("next") == 3
+        assert cache.get("new") == 2
+
+
+class TestAdmission:
+    """Test TinyLFU admission"""
+
+    def test_cold_key_rejected_over_popular_victim(self, clock):
+        """A never-requested key does not displace an often-requested entry"""
+        cache = ClockCache(maxsize=1, ttl=60, admission=True)
+        for _ in range(5):
+            cache.get("hot")
+        cache["hot"] = "H"
+
+        cache["cold"] = "C"
+
+        assert cache.get("cold") is None
+        assert cache.get("hot") == "H"
+
+    def test_frequent_key_admitted(self, clock):
+        """A key requested at least as often as the victim replaces it"""
+        cache = ClockCache(maxsize=1, ttl=60, admission=True)
+        cache.get("a")
+        cache["a"] = "A"
+        for _ in range(3):
+            cache.get("b")
+
+        cache["b"] = "B"
+
+        assert cache.get("b") == "B"
+        assert cache.get("a") is None
+
+    def test_sketch_rows_are_independent(self):
+        """Keys sharing a counter in one row rarely share it in every row"""
+        sketch = FrequencySketch(256)
+        keys = [f"/tractor/model-{i}" for i in range(2000)]
+        slots = {key: sketch._slots(key) for key in keys}
+        by_first_row = {}
+        for key, key_slots in slots.items():
+            by_first_row.setdefault(key_slots[0], []).append(key)
+
+        pairs = full_collisions = 0
+        for group in by_first_row.values():
+            for i, a in enumerate(group):
+                for b in group[i + 1:]:
+                    pairs += 1
+                    full_collisions += slots[a] == slots[b]
+
+        assert pairs > 0
+        assert full_collisions / pairs < 0.01
+
+    def test_sketch_ages_counts(self):
+        """Counters are halved once the sample size is reached"""
+        sketch = FrequencySketch(16)
+        for _ in range(8):
+            sketch.increment("key")
+        for i in range(sketch._sample_size):
+            sketch.increment(f"other-{i}")
+        assert sketch.frequency("key") < 8
@@ -2,9 +2,12 @@
 import pytest
 import asyncio
 from fastapi.testclient import TestClient
-from main import app, update_sales_data, init_db
+import tapi
+from tapi import app, update_sales_data, init_db
 import json
+import orjson
 import os
+from datetime import datetime
 
 # Test client
 client = TestClient(app)
@@ -13,7 +16,7 @@ client = TestClient(app)
 def setup_test_db():
     """Setup test database before running tests"""
     # Use a test database
-    os.environ["DB_FILE"] = "test_framtrack.db"
+    tapi.DB_FILE = "test_framtrack.db"
     init_db()
     
     # Run initial data update
@@ -22,8 +25,10 @@ def setup_test_db():
     yield
     
     # Cleanup after tests
-    if os.path.exists("test_framtrack.db"):
-        os.remove("test_framtrack.db")
+    tapi.get_db_connection().close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists("test_framtrack.db" + suffix):
+            os.remove("test_framtrack.db" + suffix)
 
 class TestAPIEndpoints:
     """Test all API endpoints"""
@@ -243,6 +248,96 @@ class TestAsyncOperations:
         data = response.json()
         assert data["success"] is True
 
+class TestResponseCache:
+    """Test the pre-encoded responses rebuilt from sales_data"""
+    
+    def test_sales_body_matches_sales_data(self):
+        """The cached sales body encodes the current sales_data"""
+        response = client.get("/api/v1/tractor-sales")
+        assert response.content == tapi._sales_json
+        assert response.json() == {
+            "success": True,
+            "data": tapi.sales_data,
+            "last_updated": tapi.last_update,
+            "total_market_size": round(sum(c["revenue"] for c in tapi.sales_data), 1)
+        }
+    
+    def test_root_body_includes_last_update(self):
+        """The root body is API_INFO plus the last update time"""
+        response = client.get("/")
+        assert response.json() == {**tapi.API_INFO, "last_updated": tapi.last_update}
+    
+    def test_bodies_follow_updates(self):
+        """An update re-encodes the sales, root and company bodies"""
+        asyncio.run(update_sales_data())
+        first = tapi.sales_data
+        asyncio.run(update_sales_data())
+        assert tapi.sales_data is not first
+        assert orjson.loads(tapi._sales_json)["data"] == tapi.sales_data
+        assert orjson.loads(tapi._root_json)["last_updated"] == tapi.last_update
+        for company in tapi.sales_data:
+            assert orjson.loads(tapi._company_json_by_name[company["company_name"].lower()]) == company
+    
+    def test_company_lookup_ignores_case(self):
+        """Every company is served from the lowercase index whatever the request's case"""
+        for company in tapi.sales_data:
+            for name in (company["company_name"], company["company_name"].upper(), company["company_name"].lower()):
+                response = client.get(f"/api/v1/company/{name}")
+                assert response.status_code == 200
+                assert response.json() == company
+    
+    def test_empty_sales_data(self, monkeypatch):
+        """Without sales data the sales and company endpoints return 503"""
+        monkeypatch.setattr(tapi, "sales_data", [])
+        monkeypatch.setattr(tapi, "_sales_json", b"")
+        assert client.get("/api/v1/tractor-sales").status_code == 503
+        assert client.get("/api/v1/company/Kubota").status_code == 503
+
+class TestExternalData:
+    """Test the simulated sales data"""
+    
+    def test_rows_follow_company_table(self):
+        """Each row stays within its company's base figures and variation bounds"""
+        rows = asyncio.run(tapi.fetch_external_data())
+        assert [row["company_name"] for row in rows] == list(tapi.TRACTOR_COMPANIES)
+        assert [row["rank"] for row in rows] == list(range(1, 6))
+        for row in rows:
+            base = tapi.TRACTOR_COMPANIES[row["company_name"]]
+            # Variation is 0.85-1.25 and the seasonal factor 0.8-1.2
+            assert int(base["base_sales"] * 0.85 * 0.8) <= row["daily_sales"] <= base["base_sales"] * 1.25 * 1.2
+            assert base["base_revenue"] * 0.85 * 0.8 - 0.05 <= row["revenue"] <= base["base_revenue"] * 1.25 * 1.2 + 0.05
+            assert base["market_share"] * 0.95 - 0.05 <= row["market_share"] <= base["market_share"] * 1.05 + 0.05
+            assert row["popular_models"] == base["models"]
+            assert type(row["daily_sales"]) is int
+            assert type(row["revenue"]) is float
+    
+    def test_trends_recorded_per_update(self):
+        """Each update records total sales and average revenue trends"""
+        asyncio.run(update_sales_data())
+        trends = client.get("/api/v1/market-trends").json()["trends"]
+        latest = {t["trend_type"]: t for t in trends if t["date_recorded"] == tapi.last_update}
+        assert latest["total_daily_sales"]["value"] == sum(c["daily_sales"] for c in tapi.sales_data)
+        assert latest["avg_revenue"]["value"] == pytest.approx(
+            sum(c["revenue"] for c in tapi.sales_data) / len(tapi.sales_data)
+        )
+        dates = [t["date_recorded"] for t in trends]
+        assert dates == sorted(dates, reverse=True)
+
+class TestUpdateSchedule:
+    """Test the time until the next scheduled update"""
+    
+    @pytest.mark.parametrize("now, expected", [
+        (datetime(2024, 5, 1, 0, 0), 12 * 3600),
+        (datetime(2024, 5, 1, 11, 0), 3600),
+        (datetime(2024, 5, 1, 11, 59, 59, 500000), 0.5),
+        (datetime(2024, 5, 1, 12, 0), 12 * 3600),
+        (datetime(2024, 5, 1, 23, 30), 1800),
+        (datetime(2024, 12, 31, 18, 0), 6 * 3600),
+    ])
+    def test_seconds_until_next_update(self, now, expected):
+        """Waits until the next 00:00 or 12:00, rolling over to the next day"""
+        assert tapi.seconds_until_next_update(now) == expected
+
 # Integration tests
 class TestIntegration:
     """Integration tests for complete workflows"""
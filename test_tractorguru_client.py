@@ -0,0 +1,192 @@
+# test_tractorguru_client.py - TractorGuru scraper parsing and caching tests
+import os
+import random
+import signal
+import threading
+
+import httpx
+import pytest
+from lxml import html as lxml_html
+
+from services.tractorguru_client import TractorGuruClient, _parse_details
+
+BASE_URL = "https://tractorguru.in"
+
+
+def _text(el):
+    return "".join(part.strip() for part in el.itertext())
+
+
+def _reference_details(html):
+    """Whole-DOM extraction the streaming parser must agree with"""
+    tree = lxml_html.fromstring(html) if html.strip() else lxml_html.Element("html")
+
+    title = tree.find(".//h1")
+    if title is None:
+        title = tree.find(".//title")
+
+    specs = {}
+    for table in tree.iter("table"):
+        has_headers = len(list(table.iter("th"))) > 1
+        for row in table.iter("tr"):
+            cells = [_text(c) for c in (row.iter("td") if has_headers else row.iter("td", "th"))]
+            if len(cells) == 2 and all(cells):
+                specs[cells[0]] = cells[1]
+
+    images = [img.get("src").strip() for img in tree.iter("img") if img.get("src")]
+    return {
+        "title": _text(title) if title is not None else "",
+        "path": "/model",
+        "url": f"{BASE_URL}/model",
+        "specs": specs,
+        "images": images[:10],
+    }
+
+
+def _random_page(rng):
+    def cell():
+        return rng.choice(["<td>k{}</td>", "<th>h{}</th>", "<td></td>", "<td>v{} <i>i</i></td>"]).format(rng.randint(0, 5))
+
+    def fragment(depth=0):
+        r = rng.random()
+        if r < 0.15:
+            return f'<img src="{rng.choice(["", " /a%d.png " % rng.randint(0, 99)])}">'
+        if r < 0.25:
+            inner = rng.choice(["", '<img src="logo.png">', "<span>Brand</span> "])
+            return f"<h1>{inner}H{rng.randint(0, 9)} <b>x</b>{rng.choice(['', '<img src=h.png>'])}</h1>"
+        if r < 0.45 and depth < 2:
+            rows = "".join(
+                "<tr>" + "".join(cell() for _ in range(rng.randint(1, 3)))
+                + (f"<td>{fragment(depth + 1)}</td>" if rng.random() < 0.2 else "") + "</tr>"
+                for _ in range(rng.randint(1, 4))
+            )
+            return f"<table>{rows}</table>"
+        if r < 0.5:
+            return "<title> tt </title>"
+        return f"<div><p>text ₹ {rng.randint(0, 9)}</p>{fragment(depth + 1) if depth < 3 else ''}</div>"
+
+    head = "<title>T</title>" if rng.random() < 0.5 else ""
+    body = "".join(fragment() for _ in range(rng.randint(0, 25)))
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+
+class TestModelDetailsParsing:
+    """Test the streaming model detail parser"""
+
+    def test_heading_with_nested_image_keeps_text(self):
+        """Elements closing inside an open <h1> must not prune its text"""
+        html = '<html><body><h1><span>John Deere</span> 5050D <img src="logo.png"></h1></body></html>'
+        data = _parse_details(html, "/model", BASE_URL)
+        assert data["title"] == "John Deere5050D"
+        assert data["images"] == ["logo.png"]
+
+    def test_title_fallback_without_heading(self):
+        """The <title> is used when the page has no <h1>"""
+        data = _parse_details("<html><head><title> Only title </title></head><body></body></html>", "/model", BASE_URL)
+        assert data["title"] == "Only title"
+
+    @pytest.mark.parametrize("html", ["", "   ", "<p>x</p>"])
+    def test_blank_pages(self, html):
+        """Blank or minimal pages give empty results rather than errors"""
+        assert _parse_details(html, "/model", BASE_URL) == _reference_details(html)
+
+    def test_matches_whole_dom_extraction(self):
+        """Streaming results equal a whole-DOM walk on randomized pages"""
+        rng = random.Random(5)
+        for _ in range(500):
+            html = _random_page(rng)
+            assert _parse_details(html, "/model", BASE_URL) == _reference_details(html), html
+
+
+class TestPageRevalidation:
+    """Test ETag revalidation of stale cached pages"""
+
+    def test_stale_page_revalidated_with_etag(self):
+        """A stale page is requested with If-None-Match and a 304 reuses the stored body"""
+        page = "<html><body><h1>5050D</h1></body></html>"
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, text=page, headers={"ETag": '"v1"'})
+
+        client = TractorGuruClient(base_url=BASE_URL, state_file=None)
+        client.client = httpx.Client(transport=httpx.MockTransport(handler))
+        url = f"{BASE_URL}/model"
+
+        assert client._fetch("/model") == page
+        assert "If-None-Match" not in requests[0].headers
+
+        # Fresh copies are served without a request
+        assert client._fetch("/model") == page
+        assert len(requests) == 1
+
+        cached = client._page_cache.get(url)
+        client._page_cache[url] = cached._replace(fresh_until=0)
+
+        assert client._fetch("/model") == page
+        assert len(requests) == 2
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+        revalidated = client._page_cache.get(url)
+        assert revalidated.html is cached.html
+        assert revalidated.etag == '"v1"'
+        assert revalidated.fresh_until > 0
+
+
+def _model_page(path):
+    return f"<html><body><h1>Model {path}</h1><table><tr><td>HP</td><td>50</td></tr></table></body></html>"
+
+
+@pytest.fixture
+def batch_client():
+    """Client serving generated model pages, shutting its parse pool down afterwards"""
+    in_flight = []
+    overlap = threading.Event()
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            in_flight.append(request.url.path)
+            if len(in_flight) > 1:
+                overlap.set()
+        # Hold each request until another one is in flight, or give up after a second
+        overlap.wait(1)
+        with lock:
+            in_flight.remove(request.url.path)
+        return httpx.Response(200, text=_model_page(request.url.path))
+
+    client = TractorGuruClient(base_url=BASE_URL, state_file=None)
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    client.overlap = overlap
+    yield client
+    if client._pool is not None:
+        client._pool.shutdown()
+
+
+def _expected(path):
+    return _parse_details(_model_page(path), path, BASE_URL)
+
+
+class TestModelDetailsBatch:
+    """Test parsing several model pages at once"""
+
+    def test_pages_fetched_concurrently(self, batch_client):
+        """Uncached pages are requested in parallel and returned in request order"""
+        paths = ["/b", "/a", "/c"]
+        assert batch_client.get_models_details(paths) == [_expected(path) for path in paths]
+        assert batch_client.overlap.is_set()
+
+    def test_recovers_from_broken_pool(self, batch_client):
+        """A batch after the parser processes die still parses, and the next gets a new pool"""
+        assert batch_client.get_models_details(["/a", "/b"]) == [_expected("/a"), _expected("/b")]
+        broken = batch_client._pool
+        for pid in list(broken._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        assert batch_client.get_models_details(["/c", "/d"]) == [_expected("/c"), _expected("/d")]
+        assert batch_client._pool is None
+
+        assert batch_client.get_models_details(["/e", "/f"]) == [_expected("/e"), _expected("/f")]
+        assert batch_client._pool is not None and batch_client._pool is not broken